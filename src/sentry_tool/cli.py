@@ -1,31 +1,74 @@
+import importlib
 from typing import Annotated
 
+import click
 import typer
+from typer.core import TyperGroup
+from typer.models import CommandInfo
 
 from sentry_tool.__about__ import __version__
-from sentry_tool.commands import config, events, issues, projects, traces
-from sentry_tool.monitoring import setup_logging, setup_sentry
-from sentry_tool.utils import set_active_profile, set_active_project
+
+# Subcommands are resolved on first use so an invocation only imports the module it runs.
+# Maps command name -> (module path, attribute). Order here is the order shown in --help.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "list": ("sentry_tool.commands.issues", "list_issues"),
+    "show": ("sentry_tool.commands.issues", "show_issue"),
+    "event": ("sentry_tool.commands.events", "show_event"),
+    "events": ("sentry_tool.commands.events", "list_events"),
+    "tags": ("sentry_tool.commands.events", "show_tags"),
+    "transactions": ("sentry_tool.commands.traces", "list_transactions"),
+    "trace": ("sentry_tool.commands.traces", "lookup_trace"),
+    "transaction": ("sentry_tool.commands.traces", "show_transaction"),
+    "spans": ("sentry_tool.commands.traces", "show_spans"),
+    "list-projects": ("sentry_tool.commands.projects", "list_projects"),
+    "open": ("sentry_tool.commands.projects", "open_sentry"),
+    "shell": ("sentry_tool.commands.shell", "run_shell"),
+}
+_LAZY_GROUPS: dict[str, tuple[str, str]] = {
+    "config": ("sentry_tool.commands.config", "config_app"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports subcommand modules only when they are resolved."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*_LAZY_COMMANDS, *_LAZY_GROUPS]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands:
+            command = _load_command(cmd_name)
+            if command is None:
+                return None
+            self.commands[cmd_name] = command
+        return self.commands[cmd_name]
+
+
+def _load_command(cmd_name: str) -> click.Command | None:
+    if cmd_name in _LAZY_GROUPS:
+        module_name, attr = _LAZY_GROUPS[cmd_name]
+        group = typer.main.get_group(getattr(importlib.import_module(module_name), attr))
+        group.name = cmd_name
+        return group
+
+    if cmd_name in _LAZY_COMMANDS:
+        module_name, attr = _LAZY_COMMANDS[cmd_name]
+        callback = getattr(importlib.import_module(module_name), attr)
+        return typer.main.get_command_from_info(
+            CommandInfo(name=cmd_name, callback=callback),
+            pretty_exceptions_short=app.pretty_exceptions_short,
+            rich_markup_mode=app.rich_markup_mode,
+        )
+
+    return None
+
 
 app = typer.Typer(
+    cls=LazyTyperGroup,
     help="Sentry Tool - Query and manage Sentry issues.",
     no_args_is_help=True,
 )
 
-app.add_typer(config.config_app, name="config")
-
-app.command("list")(issues.list_issues)
-app.command("show")(issues.show_issue)
-app.command("event")(events.show_event)
-app.command("events")(events.list_events)
-app.command("tags")(events.show_tags)
-app.command("transactions")(traces.list_transactions)
-app.command("trace")(traces.lookup_trace)
-app.command("transaction")(traces.show_transaction)
-app.command("spans")(traces.show_spans)
-app.command("list-projects")(projects.list_projects)
-app.command("open")(projects.open_sentry)
-
 
 def version_callback(value: bool) -> None:
     if value:
@@ -55,12 +98,19 @@ def callback(
     ] = None,
 ) -> None:
     """Handle global options before subcommand dispatch."""
+    from sentry_tool.utils import set_active_profile, set_active_project  # noqa: PLC0415
+
     set_active_profile(profile)
     set_active_project(project)
 
 
 def cli() -> None:
-    """Configure logging and Sentry, then run the CLI app."""
+    """Configure logging, then run the CLI app; Sentry is only set up if it crashes."""
+    from sentry_tool.monitoring import report_exception, setup_logging  # noqa: PLC0415
+
     setup_logging()
-    setup_sentry(environment="local")
-    app()
+    try:
+        app()
+    except Exception as exc:
+        report_exception(exc, environment="local")
+        raise
@@ -1,16 +1,84 @@
 """Sentry API client with automatic retry for transient failures."""
 
+import atexit
+import contextlib
+import copy
+import functools
+import random
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
 from typing import Any
 
 import requests
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
+from sentry_tool import http_cache
 from sentry_tool.monitoring import get_logger
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup ("fast" extra)
+    _HAS_ORJSON = False
+
 log = get_logger("client")
 
+HTTP_NO_CONTENT = 204
+HTTP_NOT_MODIFIED = 304
 HTTP_NOT_FOUND = 404
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
 MAX_DETAIL_LENGTH = 500
+MAX_ATTEMPTS = 3
+RETRY_MIN_WAIT = 2
+RETRY_MAX_WAIT = 10
+# Longest Retry-After the client will honour; a longer server hint is clamped.
+RETRY_AFTER_MAX_WAIT = 60
+
+# Seconds to wait for the connection warm-up request before giving up.
+WARMUP_TIMEOUT = 2
+
+# Seconds a successful response is reused in-process, and how many are kept.
+RESPONSE_TTL = 30
+RESPONSE_CACHE_SIZE = 256
+
+# Keep-alive connections kept per Sentry host; concurrent callers should not
+# use more threads than this or the surplus connections are thrown away.
+POOL_MAXSIZE = 20
+
+# Shared session so consecutive calls to the same Sentry host reuse pooled
+# keep-alive connections. Retries are handled by api_call, not urllib3.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=10, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+)
+_SESSION.mount(
+    "http://", HTTPAdapter(pool_connections=10, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+)
+# requests always asks for gzip/deflate; urllib3's list also includes br and zstd
+# when their decoders (brotli, zstandard) are installed.
+_SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+atexit.register(_SESSION.close)
+
+# (token, url) -> (monotonic expiry, parsed body), oldest first. Only the shell
+# turns it on: a one-shot command never reads a response twice, so copying
+# bodies into it would be pure overhead. The lock guards reads and eviction
+# against commands that call api_call from several threads.
+_recent_responses: dict[tuple[str, str], tuple[float, Any]] = {}
+_recent_lock = threading.Lock()
+_response_cache_enabled = False
+
+# Failures worth another attempt; a truncated body is retried like a dropped connection.
+_TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
 
 
 class NotFoundError(Exception):
@@ -30,15 +98,128 @@ def _extract_error_detail(response: requests.Response) -> str:
     return str(body)
 
 
-@retry(
-    retry=retry_if_exception_type(requests.exceptions.RequestException),
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-)
-def api_call(endpoint: str, token: str, base_url: str) -> Any:
-    full_url = f"{base_url}/api/0{endpoint}"
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(full_url, headers=headers, timeout=30)
+def api_call(endpoint: str, token: str, base_url: str, *, cache: bool = True) -> Any:
+    """GET a Sentry API endpoint, retrying transient request failures.
+
+    Connection errors, timeouts, 429 and 5xx responses are retried up to
+    MAX_ATTEMPTS times. Each wait is drawn at random between zero and an
+    exponential ceiling (RETRY_MIN_WAIT doubling up to RETRY_MAX_WAIT), so
+    clients that failed together do not retry in lockstep. A Retry-After header
+    on the failed response raises the wait to at least that long (at most
+    RETRY_AFTER_MAX_WAIT). NotFoundError and other HTTP errors are raised immediately.
+    A 204 or empty response body returns None without being parsed.
+
+    Once enable_response_cache() has been called (the shell does), successful
+    responses are kept in memory for RESPONSE_TTL seconds, so the same read
+    repeated within the process skips the request. Every caller gets its own
+    copy of the data. Pass cache=False to always ask the server (the fresh
+    response still replaces the cached one).
+    """
+    if not _response_cache_enabled:
+        return _get_with_retries(endpoint, token, base_url)
+
+    key = (token, _api_prefix(base_url) + endpoint)
+    if cache:
+        with _recent_lock:
+            recent = _recent_responses.get(key)
+        if recent is not None and recent[0] > time.monotonic():
+            return copy.deepcopy(recent[1])
+
+    body = _get_with_retries(endpoint, token, base_url)
+    stored = copy.deepcopy(body)
+    with _recent_lock:
+        if key not in _recent_responses and len(_recent_responses) >= RESPONSE_CACHE_SIZE:
+            del _recent_responses[next(iter(_recent_responses))]
+        _recent_responses[key] = (time.monotonic() + RESPONSE_TTL, stored)
+    return body
+
+
+def enable_response_cache() -> None:
+    """Reuse responses in-process for RESPONSE_TTL seconds; for long-lived sessions."""
+    global _response_cache_enabled  # noqa: PLW0603
+    _response_cache_enabled = True
+
+
+def clear_response_cache() -> None:
+    with _recent_lock:
+        _recent_responses.clear()
+
+
+def warmup(base_url: str) -> None:
+    """Open a pooled keep-alive connection to base_url ahead of the first api_call.
+
+    The TCP and TLS handshakes then happen off the critical path. Failures are
+    ignored; the next real request reports them.
+    """
+    with contextlib.suppress(requests.exceptions.RequestException):
+        _SESSION.head(_api_prefix(base_url) + "/", timeout=WARMUP_TIMEOUT)
+
+
+def _get_with_retries(endpoint: str, token: str, base_url: str) -> Any:
+    for attempt in range(MAX_ATTEMPTS - 1):
+        try:
+            return _get(endpoint, token, base_url)
+        except requests.exceptions.RequestException as exc:
+            if not _is_transient(exc):
+                raise
+            time.sleep(max(_backoff(attempt), _retry_after(exc)))
+    return _get(endpoint, token, base_url)
+
+
+def _is_transient(exc: requests.exceptions.RequestException) -> bool:
+    if isinstance(exc, requests.HTTPError):
+        if exc.response is None:
+            return False
+        status = exc.response.status_code
+        return status == HTTP_TOO_MANY_REQUESTS or status >= HTTP_SERVER_ERROR
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
+
+def _backoff(attempt: int) -> float:
+    """Full jitter: uniform in [0, min(RETRY_MAX_WAIT, RETRY_MIN_WAIT * 2**attempt)]."""
+    return random.uniform(0, min(RETRY_MAX_WAIT, RETRY_MIN_WAIT * 2**attempt))
+
+
+def _retry_after(exc: requests.exceptions.RequestException) -> float:
+    """Seconds requested by the response's Retry-After header, or 0 if absent or invalid.
+
+    Accepts both delta-seconds and HTTP-date values.
+    """
+    value = exc.response.headers.get("Retry-After") if exc.response is not None else None
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX_WAIT)
+
+
+@functools.lru_cache(maxsize=8)
+def _api_prefix(base_url: str) -> str:
+    """API root for a Sentry URL; a trailing slash on base_url is dropped."""
+    return base_url.rstrip("/") + "/api/0"
+
+
+@functools.lru_cache(maxsize=32)
+def _auth_headers(token: str) -> Mapping[str, str]:
+    """Request headers for a token, built once; read-only because they are shared."""
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+def _get(endpoint: str, token: str, base_url: str) -> Any:
+    full_url = _api_prefix(base_url) + endpoint
+    headers = _auth_headers(token)
+    cached = http_cache.lookup(full_url, token)
+    if cached is not None:
+        headers = {**headers, **http_cache.conditional_headers(cached)}
+    response = _SESSION.get(full_url, headers=headers, timeout=30)
+
+    if response.status_code == HTTP_NOT_MODIFIED and cached is not None:
+        return cached.body
 
     if response.status_code == HTTP_NOT_FOUND:
         raise NotFoundError(endpoint)
@@ -50,4 +231,22 @@ def api_call(endpoint: str, token: str, base_url: str) -> Any:
         if detail:
             raise requests.HTTPError(f"{exc}: {detail}", response=response) from exc
         raise
+    if response.status_code == HTTP_NO_CONTENT or not response.content:
+        return None
+    body = _decode_json(response)
+    http_cache.store(full_url, token, response, body)
+    return body
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Parse the body with orjson when installed; requests' decoder handles the rest.
+
+    Bodies orjson rejects (non-UTF-8 or invalid) fall through to response.json(),
+    which raises the usual requests JSONDecodeError.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
     return response.json()
@@ -1,5 +1,18 @@
-"""CLI commands."""
+"""CLI commands.
 
-from sentry_tool.commands import config, events, issues, projects, traces
+Submodules are imported on demand by ``sentry_tool.cli`` rather than eagerly here;
+attribute access such as ``sentry_tool.commands.events`` imports just that module.
+"""
 
-__all__ = ["config", "events", "issues", "projects", "traces"]
+import importlib
+from types import ModuleType
+
+__all__ = ["config", "events", "issues", "projects", "shell", "traces"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
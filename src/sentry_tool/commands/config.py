@@ -1,21 +1,64 @@
 """Configuration management commands."""
 
-import json
+from __future__ import annotations
+
 import os
-from typing import Annotated, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-from rich.console import Console
 
-from sentry_tool.client import NotFoundError, api_call
-from sentry_tool.config import AppConfig, load_config
+from sentry_tool.client import POOL_MAXSIZE, NotFoundError, api_call
+from sentry_tool.config import load_config
 from sentry_tool.exceptions import ConfigurationError
 from sentry_tool.monitoring import get_logger
-from sentry_tool.output import Column, OutputFormat, render
+from sentry_tool.output import Column, OutputFormat, get_console, print_json, render
 from sentry_tool.utils import get_config, mask_token
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from sentry_tool.config import AppConfig, SentryProfile
+
 config_app = typer.Typer(help="Configuration management commands")
 
+# Profiles on the same Sentry host share the client's connection pool, so the
+# worker count stays within its size and every request reuses a keep-alive socket.
+MAX_PROFILE_WORKERS = min(8, POOL_MAXSIZE)
+
+# Settings `config show` reads from SENTRY_<FIELD> environment variables.
+_SHOW_ENV_FIELDS = ("profile", "url", "org", "project", "auth_token")
+
+
+def _fetch_profile_projects(
+    profiles: dict[str, SentryProfile], *, cache: bool = True
+) -> dict[str, Future[Any]]:
+    """Query the project list of every profile that has an auth token, concurrently.
+
+    Profiles without a token are left out of the result. cache=False skips
+    api_call's in-memory response cache.
+    """
+    valid: dict[str, tuple[SentryProfile, str]] = {}
+    for name, profile in profiles.items():
+        token = (profile.auth_token or "").strip()
+        if token:
+            valid[name] = (profile, token)
+
+    if not valid:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PROFILE_WORKERS, len(valid))) as executor:
+        return {
+            name: executor.submit(
+                api_call,
+                f"/organizations/{profile.org}/projects/",
+                token=token,
+                base_url=profile.url,
+                cache=cache,
+            )
+            for name, (profile, token) in valid.items()
+        }
+
 
 @config_app.command("show")
 def show(
@@ -33,15 +76,12 @@ def show(
     try:
         app_config = load_config()
     except ConfigurationError as e:
-        Console().print(f"[red]Config error: {e}[/red]")
+        get_console().print(f"[red]Config error: {e}[/red]")
         raise typer.Exit(1) from e
 
+    environ = os.environ
     env: dict[str, str | None] = {
-        "profile": os.getenv("SENTRY_PROFILE"),
-        "url": os.getenv("SENTRY_URL"),
-        "org": os.getenv("SENTRY_ORG"),
-        "project": os.getenv("SENTRY_PROJECT"),
-        "auth_token": os.getenv("SENTRY_AUTH_TOKEN"),
+        field: environ.get(f"SENTRY_{field.upper()}") for field in _SHOW_ENV_FIELDS
     }
 
     active_name = env["profile"] or app_config.default_profile
@@ -85,7 +125,7 @@ def _print_show_json(
             for name, profile in app_config.profiles.items()
         },
     }
-    print(json.dumps(output, indent=2))
+    print_json(output)
 
 
 def _print_show_tables(
@@ -94,7 +134,7 @@ def _print_show_tables(
     active_name: str | None,
     active_profile: Any,
 ) -> None:
-    console = Console()
+    console = get_console()
 
     console.print(f"\n[bold]Default profile:[/bold] {app_config.default_profile}")
     if env["profile"]:
@@ -102,13 +142,15 @@ def _print_show_tables(
 
     if active_profile:
         rows = []
-        for field, env_key in [("url", "url"), ("org", "org"), ("project", "project")]:
-            value = env[env_key] if env[env_key] else getattr(active_profile, field)
-            source = f"SENTRY_{env_key.upper()}" if env[env_key] else "profile"
+        for field in ("url", "org", "project"):
+            env_value = env[field]
+            value = env_value or getattr(active_profile, field)
+            source = f"SENTRY_{field.upper()}" if env_value else "profile"
             rows.append({"setting": field, "value": str(value), "source": source})
 
-        auth_token = env["auth_token"] if env["auth_token"] else active_profile.auth_token
-        source = "SENTRY_AUTH_TOKEN" if env["auth_token"] and auth_token else "profile"
+        token_from_env = env["auth_token"]
+        auth_token = token_from_env or active_profile.auth_token
+        source = "SENTRY_AUTH_TOKEN" if token_from_env else "profile"
         rows.append(
             {
                 "setting": "auth_token",
@@ -174,11 +216,11 @@ def list_profiles(
     try:
         app_config = load_config()
     except ConfigurationError as e:
-        Console().print(f"[red]Config error: {e}[/red]")
+        get_console().print(f"[red]Config error: {e}[/red]")
         raise typer.Exit(1) from e
 
     if not app_config.profiles:
-        Console().print("No profiles configured.")
+        get_console().print("No profiles configured.")
         return
 
     rows = [
@@ -212,7 +254,7 @@ def show_token() -> None:
     resolved = get_config()
     auth_token = resolved.get("auth_token")
     if not auth_token:
-        Console(stderr=True).print("[red]No auth token configured for active profile[/red]")
+        get_console(stderr=True).print("[red]No auth token configured for active profile[/red]")
         raise typer.Exit(1)
     print(auth_token)
 
@@ -233,7 +275,7 @@ def list_projects(
         sentry-tool config list-projects --format json
     """
     log = get_logger("config")
-    console = Console()
+    console = get_console()
 
     try:
         app_config = load_config()
@@ -245,19 +287,18 @@ def list_projects(
         console.print("No profiles configured.")
         return
 
+    futures = _fetch_profile_projects(app_config.profiles)
+
     rows: list[dict[str, str]] = []
     for profile_name, profile in app_config.profiles.items():
-        if not profile.auth_token or not profile.auth_token.strip():
+        future = futures.get(profile_name)
+        if future is None:
             rows.append({"profile": profile_name, "project": "(no auth token)"})
             log.warning("profile_missing_token", profile=profile_name)
             continue
 
         try:
-            projects = api_call(
-                f"/organizations/{profile.org}/projects/",
-                token=profile.auth_token.strip(),
-                base_url=profile.url,
-            )
+            projects = future.result() or []
 
             if not projects:
                 rows.append({"profile": profile_name, "project": "(no projects)"})
@@ -303,7 +344,7 @@ def validate(
         sentry-tool config validate --format json
     """
     log = get_logger("config")
-    console = Console()
+    console = get_console()
 
     try:
         app_config = load_config()
@@ -315,9 +356,13 @@ def validate(
         console.print("No profiles configured.")
         return
 
+    # Validation must reach the server, not reuse a recent response.
+    futures = _fetch_profile_projects(app_config.profiles, cache=False)
+
     rows: list[dict[str, str]] = []
     for profile_name, profile in app_config.profiles.items():
-        if not profile.auth_token or not profile.auth_token.strip():
+        future = futures.get(profile_name)
+        if future is None:
             rows.append(
                 {
                     "profile": profile_name,
@@ -329,11 +374,7 @@ def validate(
             continue
 
         try:
-            projects = api_call(
-                f"/organizations/{profile.org}/projects/",
-                token=profile.auth_token.strip(),
-                base_url=profile.url,
-            )
+            projects = future.result() or []
 
             slugs = [proj.get("slug", "unknown") for proj in projects]
             slugs_str = ", ".join(slugs) if slugs else "(none)"
@@ -1,23 +1,39 @@
 """Event-related commands."""
 
-from typing import Annotated
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any
 
 import typer
-from rich.console import Console
 
 from sentry_tool.output import (
     Column,
     OutputFormat,
+    get_console,
     print_event_context,
     print_exception_entry,
     render,
     render_event_basic_info,
 )
-from sentry_tool.services import resolve_issue_to_numeric
+from sentry_tool.services import issue_numeric_id, resolve_issue_to_numeric
 from sentry_tool.utils import api, get_config
 
 app = typer.Typer(help="Event management commands")
 
+_EVENT_LIST_COLUMNS = (
+    Column("Event ID", "eventID", style="dim", max_width=36),
+    Column("Date", "date"),
+    Column("Server", "server"),
+)
+_TAG_VALUE_COLUMNS = (
+    Column("Value", "value", max_width=30),
+    Column("Count", "count", justify="right"),
+    Column("Percent", "percent", justify="right"),
+)
+_TAG_KEY_COLUMNS = (
+    Column("Tag Key", "key"),
+    Column("Unique Values", "total", justify="right"),
+)
+
 
 @app.command("event")
 def show_event(
@@ -46,26 +62,22 @@ def show_event(
     """
     config = get_config()
 
-    numeric_id, short_id = resolve_issue_to_numeric(config, issue_id)
-
-    if event_id:
-        event = api(
-            f"/organizations/{config['org']}/issues/{numeric_id}/events/{event_id}/",
-            token=config["auth_token"],
-            base_url=config["url"],
-        )
+    if issue_id.isdigit():
+        # A numeric ID is already usable in the event URL, so fetch the event while
+        # the issue lookup (needed only for the short ID heading) is in flight.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            resolved = executor.submit(resolve_issue_to_numeric, config, issue_id)
+            event = _fetch_event(config, issue_id, event_id)
+            _numeric_id, short_id = resolved.result()
     else:
-        event = api(
-            f"/organizations/{config['org']}/issues/{numeric_id}/events/latest/",
-            token=config["auth_token"],
-            base_url=config["url"],
-        )
+        numeric_id, short_id = resolve_issue_to_numeric(config, issue_id)
+        event = _fetch_event(config, numeric_id, event_id)
 
     if format == OutputFormat.json:
         render([event], format)
         return
 
-    console = Console()
+    console = get_console()
 
     render_event_basic_info(console, event, short_id)
 
@@ -89,6 +101,17 @@ def show_event(
     console.print()
 
 
+def _fetch_event(config: dict[str, Any], numeric_id: str, event_id: str | None) -> Any:
+    return (
+        api(
+            f"/organizations/{config['org']}/issues/{numeric_id}/events/{event_id or 'latest'}/",
+            token=config["auth_token"],
+            base_url=config["url"],
+        )
+        or {}
+    )
+
+
 @app.command("events")
 def list_events(
     issue_id: Annotated[str, typer.Argument(help="Issue ID (numeric or short ID)")],
@@ -108,7 +131,7 @@ def list_events(
     """
     config = get_config()
 
-    numeric_id, _short_id = resolve_issue_to_numeric(config, issue_id)
+    numeric_id = issue_numeric_id(config, issue_id)
 
     events = api(
         f"/organizations/{config['org']}/issues/{numeric_id}/events/",
@@ -117,31 +140,28 @@ def list_events(
     )
 
     if not events:
-        Console().print("No events found")
+        get_console().print("No events found")
         return
 
     events = events[:max_rows]
 
-    rows = []
-    for evt in events:
-        evt_id = evt.get("eventID", evt.get("id", ""))
-        date = evt.get("dateCreated", "")[:19]
+    rows = [
+        {
+            "eventID": evt.get("eventID", evt.get("id", "")),
+            "date": (evt.get("dateCreated") or "")[:19],
+            "server": _server_name(evt),
+        }
+        for evt in events
+    ]
 
-        server = "-"
-        for tag in evt.get("tags", []):
-            if tag.get("key") == "server_name":
-                server = tag.get("value", "-")
-                break
+    render(rows, format, columns=_EVENT_LIST_COLUMNS, footer=f"Showing {len(events)} events")
 
-        rows.append({"eventID": evt_id, "date": date, "server": server})
 
-    columns = [
-        Column("Event ID", "eventID", style="dim", max_width=36),
-        Column("Date", "date"),
-        Column("Server", "server"),
-    ]
-
-    render(rows, format, columns=columns, footer=f"Showing {len(events)} events")
+def _server_name(event: dict[str, Any]) -> str:
+    return next(
+        (t.get("value", "-") for t in event.get("tags") or () if t.get("key") == "server_name"),
+        "-",
+    )
 
 
 @app.command("tags")
@@ -168,15 +188,18 @@ def show_tags(
     """
     config = get_config()
 
-    numeric_id, _short_id = resolve_issue_to_numeric(config, issue_id)
+    numeric_id = issue_numeric_id(config, issue_id)
 
-    console = Console()
+    console = get_console()
 
     if tag_key:
-        tag_data = api(
-            f"/organizations/{config['org']}/issues/{numeric_id}/tags/{tag_key}/",
-            token=config["auth_token"],
-            base_url=config["url"],
+        tag_data = (
+            api(
+                f"/organizations/{config['org']}/issues/{numeric_id}/tags/{tag_key}/",
+                token=config["auth_token"],
+                base_url=config["url"],
+            )
+            or {}
         )
 
         top_values = tag_data.get("topValues", [])
@@ -191,23 +214,20 @@ def show_tags(
             pct = val.get("percentage", 0) * 100
             rows.append({"value": name, "count": str(count), "percent": f"{pct:.1f}%"})
 
-        columns = [
-            Column("Value", "value", max_width=30),
-            Column("Count", "count", justify="right"),
-            Column("Percent", "percent", justify="right"),
-        ]
-
         render(
             rows,
             format,
-            columns=columns,
+            columns=_TAG_VALUE_COLUMNS,
             footer=f"Total unique values: {tag_data.get('uniqueValues', 'N/A')}",
         )
     else:
-        issue = api(
-            f"/organizations/{config['org']}/issues/{numeric_id}/",
-            token=config["auth_token"],
-            base_url=config["url"],
+        issue = (
+            api(
+                f"/organizations/{config['org']}/issues/{numeric_id}/",
+                token=config["auth_token"],
+                base_url=config["url"],
+            )
+            or {}
         )
         tags = issue.get("tags", [])
         if not tags:
@@ -218,9 +238,4 @@ def show_tags(
             {"key": tag.get("key", ""), "total": str(tag.get("totalValues", 0))} for tag in tags
         ]
 
-        columns = [
-            Column("Tag Key", "key"),
-            Column("Unique Values", "total", justify="right"),
-        ]
-
-        render(rows, format, columns=columns)
+        render(rows, format, columns=_TAG_KEY_COLUMNS)
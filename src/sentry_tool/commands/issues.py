@@ -3,13 +3,32 @@
 from typing import Annotated
 
 import typer
-from rich.console import Console
 
-from sentry_tool.output import Column, OutputFormat, render
+from sentry_tool.output import Column, OutputFormat, get_console, render
 from sentry_tool.utils import api, get_config
 
 app = typer.Typer(help="Issue management commands")
 
+_LIST_HEAD_COLUMNS = (
+    Column("ID", "id", style="dim", max_width=6),
+    Column("Short ID", "shortId", max_width=20),
+)
+_LIST_PROJECT_COLUMN = (Column("Project", "project", max_width=20),)
+_LIST_TAIL_COLUMNS = (
+    Column("Status", "status", max_width=12),
+    Column("Level", "level", max_width=8),
+    Column("Count", "count", justify="right", max_width=8),
+    Column("Title", "title", max_width=50),
+)
+_DETAIL_COLUMNS = (
+    Column("Field", "field", style="bold"),
+    Column("Value", "value"),
+)
+_TAG_COLUMNS = (
+    Column("Tag", "key"),
+    Column("Unique Values", "values", justify="right"),
+)
+
 
 @app.command("list")
 def list_issues(
@@ -40,13 +59,14 @@ def list_issues(
         sentry-tool list -A
         sentry-tool list --format json
     """
-    config = get_config()
-
     if all_projects and project:
-        console = Console()
-        console.print("[red]Error: --all-projects/-A and --project/-p are mutually exclusive[/red]")
+        typer.secho(
+            "Error: --all-projects/-A and --project/-p are mutually exclusive", fg=typer.colors.RED
+        )
         raise typer.Exit(1)
 
+    config = get_config()
+
     params = ""
     if status:
         params = f"?query=is:{status}"
@@ -65,7 +85,7 @@ def list_issues(
             base_url=config["url"],
         )
 
-    console = Console()
+    console = get_console()
 
     if not issues:
         console.print("No issues found")
@@ -88,19 +108,8 @@ def list_issues(
             row["project"] = proj.get("slug", "") if isinstance(proj, dict) else str(proj)
         rows.append(row)
 
-    columns = [
-        Column("ID", "id", style="dim", max_width=6),
-        Column("Short ID", "shortId", max_width=20),
-    ]
-    if all_projects:
-        columns.append(Column("Project", "project", max_width=20))
-    columns.extend(
-        [
-            Column("Status", "status", max_width=12),
-            Column("Level", "level", max_width=8),
-            Column("Count", "count", justify="right", max_width=8),
-            Column("Title", "title", max_width=50),
-        ]
+    columns = (
+        _LIST_HEAD_COLUMNS + (_LIST_PROJECT_COLUMN if all_projects else ()) + _LIST_TAIL_COLUMNS
     )
 
     render(rows, format, columns=columns, footer=f"Showing {len(issues)} issues")
@@ -124,17 +133,20 @@ def show_issue(
     """
     config = get_config()
 
-    issue = api(
-        f"/organizations/{config['org']}/issues/{issue_id}/",
-        token=config["auth_token"],
-        base_url=config["url"],
+    issue = (
+        api(
+            f"/organizations/{config['org']}/issues/{issue_id}/",
+            token=config["auth_token"],
+            base_url=config["url"],
+        )
+        or {}
     )
 
     if format == OutputFormat.json:
         render([issue], format)
         return
 
-    console = Console()
+    console = get_console()
 
     short_id = issue.get("shortId", issue.get("id"))
     console.print(f"\n[bold cyan]=== Issue {short_id} ===[/bold cyan]")
@@ -161,11 +173,7 @@ def show_issue(
     if last_rel:
         rows.append({"field": "Last release", "value": last_rel.get("version", "N/A")})
 
-    detail_columns = [
-        Column("Field", "field", style="bold"),
-        Column("Value", "value"),
-    ]
-    render(rows, OutputFormat.table, columns=detail_columns)
+    render(rows, OutputFormat.table, columns=_DETAIL_COLUMNS)
 
     tags = issue.get("tags", [])
     if tags:
@@ -173,12 +181,8 @@ def show_issue(
             {"key": tag.get("key", ""), "values": str(tag.get("totalValues", 0))}
             for tag in tags[:8]
         ]
-        tag_columns = [
-            Column("Tag", "key"),
-            Column("Unique Values", "values", justify="right"),
-        ]
         console.print()
-        render(tag_rows, OutputFormat.table, columns=tag_columns, footer=f"{len(tags)} tag types")
+        render(tag_rows, OutputFormat.table, columns=_TAG_COLUMNS, footer=f"{len(tags)} tag types")
 
     console.print("\n[dim]Use 'sentry-tool event <id>' to see the latest event[/dim]")
     console.print()
@@ -1,12 +1,10 @@
 """Project-related commands."""
 
-import webbrowser
 from typing import Annotated
 
 import typer
-from rich.console import Console
 
-from sentry_tool.output import Column, OutputFormat, render
+from sentry_tool.output import Column, OutputFormat, get_console, render
 from sentry_tool.utils import api, get_config
 
 app = typer.Typer(help="Project management commands")
@@ -34,7 +32,7 @@ def list_projects(
     )
 
     if not projects:
-        Console().print("No projects found")
+        get_console().print("No projects found")
         return
 
     rows = [
@@ -71,6 +69,8 @@ def open_sentry(
         sentry-tool open
         sentry-tool open 24
     """
+    import webbrowser  # noqa: PLC0415 - only this command needs it
+
     config = get_config()
 
     base = config["url"].rstrip("/")
@@ -82,5 +82,5 @@ def open_sentry(
         url = f"{base}/organizations/{org}/issues/"
 
     webbrowser.open(url)
-    console = Console()
+    console = get_console()
     console.print(f"Opened: {url}")
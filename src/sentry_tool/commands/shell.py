@@ -0,0 +1,93 @@
+"""Interactive shell for running several commands in one process."""
+
+import shlex
+import threading
+
+import click
+import typer
+from rich.console import Console
+
+from sentry_tool.client import enable_response_cache, warmup
+from sentry_tool.monitoring import get_logger
+from sentry_tool.output import get_console
+from sentry_tool.utils import find_config
+
+PROMPT = "sentry-tool> "
+EXIT_COMMANDS = frozenset({"exit", "quit"})
+
+
+def _global_args(ctx: typer.Context) -> list[str]:
+    """Rebuild the root --profile/--project flags the shell was started with."""
+    params = ctx.parent.params if ctx.parent else {}
+    args: list[str] = []
+    if params.get("profile"):
+        args += ["--profile", params["profile"]]
+    if params.get("project"):
+        args += ["--project", params["project"]]
+    return args
+
+
+def _start_warmup() -> None:
+    """Connect to the Sentry host in the background while the first prompt waits."""
+    config = find_config()
+    if config is not None:
+        threading.Thread(target=warmup, args=(config["url"],), daemon=True).start()
+
+
+def _run_line(root: click.Command, args: list[str], console: Console) -> None:
+    log = get_logger("shell")
+    try:
+        root.main(args, prog_name="sentry-tool", standalone_mode=False)
+    except click.ClickException as exc:
+        exc.show()
+    except (click.exceptions.Abort, click.exceptions.Exit):
+        pass
+    except Exception as exc:
+        log.error("command failed", command=args, error=str(exc))
+        console.print(f"[red]Error: {exc}[/red]")
+
+
+def run_shell(ctx: typer.Context) -> None:
+    """Run sentry-tool commands interactively in a single process.
+
+    Imports, pooled HTTP connections and parsed config stay warm between
+    commands, so follow-up lookups skip interpreter start-up; a read repeated
+    within 30 seconds is answered from memory. The connection to the Sentry
+    host is opened while the first prompt waits for input. Global flags
+    given before 'shell' apply to every command. Type 'exit' or press Ctrl-D to leave.
+
+    Examples:
+        sentry-tool shell
+        sentry-tool -P production shell
+    """
+    console = get_console()
+    root = ctx.find_root().command
+    global_args = _global_args(ctx)
+    enable_response_cache()
+    _start_warmup()
+
+    while True:
+        try:
+            line = input(PROMPT)
+        except EOFError:
+            console.print()
+            return
+        except KeyboardInterrupt:
+            console.print()
+            continue
+
+        try:
+            args = shlex.split(line)
+        except ValueError as exc:
+            console.print(f"[red]Error: {exc}[/red]")
+            continue
+
+        if not args:
+            continue
+        if args[0] in EXIT_COMMANDS:
+            return
+        if args[0] == "shell":
+            console.print("[red]Error: already in a shell[/red]")
+            continue
+
+        _run_line(root, global_args + args, console)
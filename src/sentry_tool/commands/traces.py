@@ -1,33 +1,54 @@
 """Trace and transaction commands."""
 
+from __future__ import annotations
+
+import operator
 import re
+import string
 from dataclasses import dataclass, field
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 from urllib.parse import quote_plus
 
-import structlog
 import typer
-from rich.console import Console
+from rich.console import Group
+from rich.style import Style
 from rich.table import Table
-from rich.tree import Tree
+from rich.text import Text
 
-from sentry_tool.output import Column, OutputFormat, render
+from sentry_tool.monitoring import get_logger
+from sentry_tool.output import Column, OutputFormat, build_table, get_console, render
 from sentry_tool.utils import api, get_config
 
-TRACE_ID_PATTERN = re.compile(r"^[0-9a-fA-F]{32}$")
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+log = get_logger("traces")
+
+TRACE_ID_LENGTH = 32
+_HEX_DIGITS = frozenset(string.hexdigits)
 MAX_DESCRIPTION_LENGTH = 50
 PERIOD_PATTERN = re.compile(r"^\d+[mhdw]$")
 DURATION_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)(ms|s)?$")
-
-
-@dataclass
+# Largest page the Sentry events API returns for a single request.
+MAX_PER_PAGE = 100
+TIMELINE_WIDTH = 40
+# ISO-8601 timestamps are shown to the second: "2024-01-02T03:04:05".
+_TIMESTAMP_SECONDS = slice(0, 19)
+_TIMELINE_BAR = "█" * TIMELINE_WIDTH
+# Span tree label styles, parsed once instead of from markup on every node.
+_BOLD = Style.parse("bold")
+_CYAN = Style.parse("cyan")
+_DIM = Style.parse("dim")
+
+
+@dataclass(slots=True)
 class SpanNode:
     span_id: str
     parent_span_id: str | None
     op: str
     description: str
     duration: float
-    children: list["SpanNode"] = field(default_factory=list)
+    children: list[SpanNode] = field(default_factory=list)
 
 
 def _build_query(  # noqa: PLR0913
@@ -171,7 +192,6 @@ def list_transactions(  # noqa: PLR0913
         sentry-tool transactions --query "user.id:123"
         sentry-tool transactions --stats --period 7d
     """
-    log = structlog.get_logger()
     config = get_config()
 
     validated_period = _validate_period(period)
@@ -200,11 +220,12 @@ def list_transactions(  # noqa: PLR0913
             "&field=p95(transaction.duration)"
             "&sort=-count()"
             "&dataset=transactions"
+            f"&per_page={min(max_rows, MAX_PER_PAGE)}"
         )
         if validated_period:
             url += f"&statsPeriod={validated_period}"
 
-        response = api(url, token=config["auth_token"], base_url=config["url"])
+        response = api(url, token=config["auth_token"], base_url=config["url"]) or {}
         events = response.get("data", [])
 
         if not events:
@@ -227,11 +248,12 @@ def list_transactions(  # noqa: PLR0913
         "&field=transaction.status&field=project&field=timestamp"
         "&sort=-timestamp"
         "&dataset=transactions"
+        f"&per_page={min(max_rows, MAX_PER_PAGE)}"
     )
     if validated_period:
         url += f"&statsPeriod={validated_period}"
 
-    response = api(url, token=config["auth_token"], base_url=config["url"])
+    response = api(url, token=config["auth_token"], base_url=config["url"]) or {}
     events = response.get("data", [])
 
     if not events:
@@ -251,7 +273,7 @@ def list_transactions(  # noqa: PLR0913
             "trace": evt.get("trace", ""),
             "duration": str(evt.get("transaction.duration", "")),
             "status": evt.get("transaction.status", ""),
-            "timestamp": evt.get("timestamp", "")[:19],
+            "timestamp": (evt.get("timestamp") or "")[_TIMESTAMP_SECONDS],
         }
         for evt in events
     ]
@@ -268,6 +290,10 @@ def list_transactions(  # noqa: PLR0913
     render(rows, format, columns=columns, footer=f"Showing {len(events)} transactions")
 
 
+def _is_trace_id(value: str) -> bool:
+    return len(value) == TRACE_ID_LENGTH and _HEX_DIGITS.issuperset(value)
+
+
 def lookup_trace(
     trace_id: Annotated[str, typer.Argument(help="Trace ID (32-character hex string)")],
     max_rows: Annotated[int, typer.Option("--max", "-n", help="Maximum events to show")] = 25,
@@ -283,20 +309,24 @@ def lookup_trace(
         sentry-tool trace abc123def456789012345678901234ab -n 10
         sentry-tool trace abc123def456789012345678901234ab --format json
     """
-    log = structlog.get_logger()
-    if not TRACE_ID_PATTERN.match(trace_id):
+    if not _is_trace_id(trace_id):
         log.error("Invalid trace ID format", trace_id=trace_id, expected="32-character hex string")
         raise typer.Exit(2)
 
     config = get_config()
 
-    response = api(
-        f"/organizations/{config['org']}/events/?query=trace:{trace_id}"
-        "&field=title&field=id&field=span_id&field=transaction.duration"
-        "&field=transaction.status&field=project&field=timestamp"
-        "&dataset=discover",
-        token=config["auth_token"],
-        base_url=config["url"],
+    response = (
+        api(
+            f"/organizations/{config['org']}/events/?query=trace:{trace_id}"
+            "&field=title&field=id&field=span_id&field=transaction.duration"
+            "&field=transaction.status&field=project&field=timestamp"
+            "&sort=timestamp"
+            "&dataset=discover"
+            f"&per_page={min(max_rows, MAX_PER_PAGE)}",
+            token=config["auth_token"],
+            base_url=config["url"],
+        )
+        or {}
     )
 
     events = response.get("data", [])
@@ -305,7 +335,6 @@ def lookup_trace(
         log.info("No events found for trace", trace_id=trace_id)
         return
 
-    events.sort(key=lambda e: e.get("timestamp", ""))
     events = events[:max_rows]
 
     if format == OutputFormat.json:
@@ -319,7 +348,7 @@ def lookup_trace(
             "duration": str(evt.get("transaction.duration", "")),
             "status": evt.get("transaction.status", ""),
             "project": evt.get("project", ""),
-            "timestamp": evt.get("timestamp", "")[:19],
+            "timestamp": (evt.get("timestamp") or "")[_TIMESTAMP_SECONDS],
         }
         for evt in events
     ]
@@ -336,19 +365,22 @@ def lookup_trace(
     render(rows, format, columns=columns, footer=f"Showing {len(events)} events")
 
 
+def _span_entries(event: dict[str, Any]) -> list[dict[str, Any]]:
+    """Data of the event's first "spans" entry; the scan stops at that entry."""
+    return next(
+        (e.get("data", []) for e in event.get("entries", []) if e.get("type") == "spans"), []
+    )
+
+
 def _extract_spans(event: dict[str, Any]) -> tuple[list[dict[str, Any]], str | None, float]:
     trace_ctx = event.get("contexts", {}).get("trace", {})
     root_span_id = trace_ctx.get("span_id")
     raw_duration = trace_ctx.get("duration")
     txn_duration = raw_duration / 1000.0 if raw_duration is not None else 0.0
-    for entry in event.get("entries", []):
-        if entry.get("type") == "spans":
-            return entry.get("data", []), root_span_id, txn_duration
-    return [], root_span_id, txn_duration
+    return _span_entries(event), root_span_id, txn_duration
 
 
 def _build_span_tree(spans: list[dict[str, Any]], root_span_id: str | None) -> SpanNode:
-    log = structlog.get_logger()
     root = SpanNode(
         span_id=root_span_id or "root",
         parent_span_id=None,
@@ -357,33 +389,49 @@ def _build_span_tree(spans: list[dict[str, Any]], root_span_id: str | None) -> S
         duration=0.0,
     )
 
-    node_map: dict[str, SpanNode] = {}
-    for span in spans:
+    # Children are linked as spans are read; a span that arrives before its
+    # parent waits in `pending` until the parent shows up. Root children keep
+    # their span index so orphans can be slotted back into span order.
+    node_map: dict[str, SpanNode] = {root.span_id: root}
+    pending: dict[str, list[tuple[int, SpanNode]]] = {}
+    root_positions: list[int] = []
+    for index, span in enumerate(spans):
         span_id = span.get("span_id", "")
-        if not span_id:
+        if not span_id or span_id == root.span_id:
+            # The transaction's own span is represented by the root node.
             continue
         if span_id in node_map:
             log.warning("Duplicate span_id skipped", span_id=span_id)
             continue
         duration = span.get("timestamp", 0) - span.get("start_timestamp", 0)
-        node_map[span_id] = SpanNode(
+        node = SpanNode(
             span_id=span_id,
             parent_span_id=span.get("parent_span_id"),
             op=span.get("op", "(unknown)"),
             description=span.get("description", "(no description)"),
             duration=duration,
         )
+        node_map[span_id] = node
+        if span_id in pending:
+            node.children.extend(child for _index, child in pending.pop(span_id))
 
-    node_map[root.span_id] = root
-
-    for node in node_map.values():
-        if node is root:
-            continue
         parent_id = node.parent_span_id
         if parent_id and parent_id in node_map:
             node_map[parent_id].children.append(node)
+            if parent_id == root.span_id:
+                root_positions.append(index)
+        elif parent_id:
+            pending.setdefault(parent_id, []).append((index, node))
         else:
             root.children.append(node)
+            root_positions.append(index)
+
+    # Spans whose parent never appeared are shown under the root, in span order.
+    if pending:
+        placed = list(zip(root_positions, root.children, strict=True))
+        placed.extend(entry for orphans in pending.values() for entry in orphans)
+        placed.sort(key=operator.itemgetter(0))
+        root.children = [node for _index, node in placed]
 
     return root
 
@@ -394,36 +442,51 @@ def _render_span_tree(
     txn_duration: float,
     console: Console | None = None,
 ) -> None:
+    from rich.tree import Tree  # noqa: PLC0415 - only the spans tree view needs it
+
     if console is None:
-        console = Console()
+        console = get_console()
 
-    tree = Tree(f"[bold]{root.op}[/bold] {root.description}")
+    # Labels are Text, so span ops and descriptions are never read as markup.
+    tree = Tree(Text.assemble((root.op, _BOLD), " ", root.description))
 
-    def _add_children(parent_tree: Tree, node: SpanNode) -> None:
+    # Iterative walk: deep traces must not hit the recursion limit. Each node's
+    # children are added together, so sibling order matches node.children.
+    stack: list[tuple[Tree, SpanNode]] = [(tree, root)]
+    while stack:
+        parent_tree, node = stack.pop()
         for child in node.children:
             desc = child.description
             if len(desc) > MAX_DESCRIPTION_LENGTH:
                 desc = desc[: MAX_DESCRIPTION_LENGTH - 3] + "..."
-            label = f"[cyan]{child.op}[/cyan] {desc} [dim]{child.duration:.3f}s[/dim]"
-            branch = parent_tree.add(label)
-            _add_children(branch, child)
+            label = Text.assemble(
+                (child.op, _CYAN), " ", desc, " ", (f"{child.duration:.3f}s", _DIM)
+            )
+            stack.append((parent_tree.add(label), child))
 
-    _add_children(tree, root)
-    console.print(tree)
-    console.print(f"\n{total_spans} spans | {txn_duration:.3f}s total")
+    # One print call: the tree and its footer are rendered and written together.
+    console.print(Group(tree, f"\n{total_spans} spans | {txn_duration:.3f}s total"))
 
 
 def _render_timeline(spans: list[dict[str, Any]], console: Console) -> None:
-    min_start = min(s.get("start_timestamp", 0) for s in spans)
-    max_end = max(s.get("timestamp", 0) for s in spans)
+    # Read each span's fields once; both the bounds pass and the rows use them.
+    parsed = [
+        (
+            s.get("op", ""),
+            s.get("description", "")[:35],
+            s.get("start_timestamp", 0),
+            s.get("timestamp", 0),
+        )
+        for s in spans
+    ]
+    min_start = min(start for _op, _desc, start, _end in parsed)
+    max_end = max(end for _op, _desc, _start, end in parsed)
     total_duration = max_end - min_start
 
     if total_duration <= 0:
         console.print("\n[dim]Cannot render timeline (zero duration)[/dim]")
         return
 
-    bar_width = 40
-
     table = Table(title="Span Timeline")
     table.add_column("Op", style="cyan", max_width=20)
     table.add_column("Description", max_width=35)
@@ -431,23 +494,15 @@ def _render_timeline(spans: list[dict[str, Any]], console: Console) -> None:
     table.add_column("Dur (s)", justify="right")
     table.add_column("Timeline", no_wrap=True)
 
-    for span in spans:
-        start = span.get("start_timestamp", 0)
-        end = span.get("timestamp", 0)
+    for op, desc, start, end in parsed:
         offset = start - min_start
         duration = end - start
 
-        pos = int(offset / total_duration * bar_width)
-        length = max(1, int(duration / total_duration * bar_width))
-        bar = " " * pos + "█" * length
+        pos = int(offset / total_duration * TIMELINE_WIDTH)
+        length = max(1, int(duration / total_duration * TIMELINE_WIDTH))
+        bar = " " * pos + _TIMELINE_BAR[:length]
 
-        table.add_row(
-            span.get("op", ""),
-            span.get("description", "")[:35],
-            f"{offset:.3f}s",
-            f"{duration:.3f}s",
-            bar,
-        )
+        table.add_row(op, desc, f"{offset:.3f}s", f"{duration:.3f}s", bar)
 
     console.print()
     console.print(table)
@@ -473,43 +528,29 @@ def show_transaction(
     """
     config = get_config()
 
-    event = api(
-        f"/organizations/{config['org']}/events/{config['project']}:{event_id}/"
-        "?dataset=transactions",
-        token=config["auth_token"],
-        base_url=config["url"],
+    event = (
+        api(
+            f"/organizations/{config['org']}/events/{config['project']}:{event_id}/"
+            "?dataset=transactions",
+            token=config["auth_token"],
+            base_url=config["url"],
+        )
+        or {}
     )
 
     if format == OutputFormat.json:
         render([event], format)
         return
 
-    console = Console()
-    console.print(f"\n[bold cyan]=== Transaction {event_id[:8]}... ===[/bold cyan]")
-
+    trace_ctx = (event.get("contexts") or {}).get("trace") or {}
     rows = [
         {"field": "Transaction", "value": event.get("title", "N/A")},
         {"field": "Event ID", "value": event.get("eventID", "N/A")},
-        {
-            "field": "Trace ID",
-            "value": event.get("contexts", {}).get("trace", {}).get("trace_id", "N/A"),
-        },
-        {
-            "field": "Span ID",
-            "value": event.get("contexts", {}).get("trace", {}).get("span_id", "N/A"),
-        },
-        {
-            "field": "Parent Span",
-            "value": event.get("contexts", {}).get("trace", {}).get("parent_span_id", "N/A"),
-        },
-        {
-            "field": "Duration",
-            "value": f"{event.get('contexts', {}).get('trace', {}).get('duration', 'N/A')} ms",
-        },
-        {
-            "field": "Status",
-            "value": event.get("contexts", {}).get("trace", {}).get("status", "N/A"),
-        },
+        {"field": "Trace ID", "value": trace_ctx.get("trace_id", "N/A")},
+        {"field": "Span ID", "value": trace_ctx.get("span_id", "N/A")},
+        {"field": "Parent Span", "value": trace_ctx.get("parent_span_id", "N/A")},
+        {"field": "Duration", "value": f"{trace_ctx.get('duration', 'N/A')} ms"},
+        {"field": "Status", "value": trace_ctx.get("status", "N/A")},
         {"field": "Timestamp", "value": event.get("dateCreated", "N/A")},
     ]
 
@@ -517,41 +558,40 @@ def show_transaction(
         Column("Field", "field", style="bold"),
         Column("Value", "value"),
     ]
-    render(rows, OutputFormat.table, columns=detail_columns)
-
-    entries = event.get("entries", [])
-    spans = []
-    for entry in entries:
-        if entry.get("type") == "spans":
-            spans = entry.get("data", [])
-            break
-
-    if spans:
-        if timeline:
-            _render_timeline(spans, console)
-        else:
-            span_rows = [
-                {
-                    "operation": span.get("op", ""),
-                    "description": span.get("description", "")[:50],
-                    "duration": f"{span.get('timestamp', 0) - span.get('start_timestamp', 0):.3f}",
-                }
-                for span in spans
-            ]
-
-            span_columns = [
-                Column("Operation", "operation", max_width=20),
-                Column("Description", "description", max_width=50),
-                Column("Duration (s)", "duration", justify="right"),
-            ]
-            console.print()
-            render(
-                span_rows, OutputFormat.table, columns=span_columns, footer=f"{len(spans)} spans"
-            )
+
+    spans: list[dict[str, Any]] = _span_entries(event)
+
+    # Everything but the timeline goes out as one Group, so Rich lays it out in one pass.
+    console = get_console()
+    parts: list[RenderableType] = [
+        f"\n[bold cyan]=== Transaction {event_id[:8]}... ===[/bold cyan]",
+        build_table(rows, detail_columns),
+    ]
+
+    if spans and timeline:
+        console.print(Group(*parts))
+        _render_timeline(spans, console)
+        parts = []
+    elif spans:
+        span_rows = [
+            {
+                "operation": span.get("op", ""),
+                "description": span.get("description", "")[:50],
+                "duration": f"{span.get('timestamp', 0) - span.get('start_timestamp', 0):.3f}",
+            }
+            for span in spans
+        ]
+
+        span_columns = [
+            Column("Operation", "operation", max_width=20),
+            Column("Description", "description", max_width=50),
+            Column("Duration (s)", "duration", justify="right"),
+        ]
+        parts += ["", build_table(span_rows, span_columns), f"\n{len(spans)} spans"]
     else:
-        console.print("\n[dim]No span data found[/dim]")
+        parts.append("\n[dim]No span data found[/dim]")
 
-    console.print()
+    console.print(Group(*parts, ""))
 
 
 def show_spans(
@@ -572,14 +612,16 @@ def show_spans(
         sentry-tool spans d3f1d81247ad4516b61da92f1db050dd --format json
         sentry-tool spans d3f1d81247ad4516b61da92f1db050dd --op db.query
     """
-    log = structlog.get_logger()
     config = get_config()
 
-    event = api(
-        f"/organizations/{config['org']}/events/{config['project']}:{event_id}/"
-        "?dataset=transactions",
-        token=config["auth_token"],
-        base_url=config["url"],
+    event = (
+        api(
+            f"/organizations/{config['org']}/events/{config['project']}:{event_id}/"
+            "?dataset=transactions",
+            token=config["auth_token"],
+            base_url=config["url"],
+        )
+        or {}
     )
 
     spans, root_span_id, txn_duration = _extract_spans(event)
@@ -589,7 +631,8 @@ def show_spans(
         return
 
     if op:
-        op_filters = {o.strip() for o in op.split(",")}
+        # The event detail endpoint returns every span; it has no span query filter.
+        op_filters = frozenset(o.strip() for o in op.split(",")) - {""}
         spans = [s for s in spans if s.get("op") in op_filters]
         if not spans:
             log.info("No spans matching op filter", op=op)
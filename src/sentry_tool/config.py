@@ -7,53 +7,110 @@ Loads configuration from multiple sources with layered precedence:
 4. Default values (lowest priority)
 """
 
+import functools
 import os
 import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from sentry_tool.exceptions import ConfigurationError
 
 
-class SentryProfile(BaseModel):
+def _optional_str(data: dict[str, Any], key: str, default: str | None, where: str) -> str | None:
+    value = data.get(key, default)
+    if value is not None and not isinstance(value, str):
+        msg = f"{where}{key} must be a string, got {type(value).__name__}"
+        raise ConfigurationError(msg)
+    return value
+
+
+def _str(data: dict[str, Any], key: str, default: str, where: str) -> str:
+    value = _optional_str(data, key, default, where)
+    if value is None:
+        msg = f"{where}{key} must be a string, got null"
+        raise ConfigurationError(msg)
+    return value
+
+
+@dataclass(slots=True)
+class SentryProfile:
     """All fields optional in profile, required after resolution with env vars."""
 
-    url: str = Field(
-        default="https://sentry.io",
-        description="Base URL for Sentry instance",
-    )
-    org: str = Field(
-        default="sentry",
-        description="Sentry organization slug",
-    )
-    project: str = Field(
-        default="otel-collector",
-        description="Sentry project slug",
-    )
-    auth_token: str | None = Field(
-        default=None,
-        description="Sentry API authentication token",
-    )
-
-
-class AppConfig(BaseModel):
-    """Application-wide configuration with profile management."""
-
-    default_profile: str = Field(default="default")
-    profiles: dict[str, SentryProfile] = Field(default_factory=lambda: {"default": SentryProfile()})
-    sentry_dsn: str | None = Field(
-        default=None,
-        description="Sentry DSN override (env var > config > hardcoded default)",
-    )
+    url: str = "https://sentry.io"
+    org: str = "sentry"
+    project: str = "otel-collector"
+    auth_token: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], name: str = "") -> "SentryProfile":
+        """Build from a [profiles.<name>] table; unknown keys are ignored.
+
+        Raises ConfigurationError if a field has the wrong type.
+        """
+        where = f"profiles.{name}." if name else ""
+        defaults = cls()
+        return cls(
+            url=_str(data, "url", defaults.url, where),
+            org=_str(data, "org", defaults.org, where),
+            project=_str(data, "project", defaults.project, where),
+            auth_token=_optional_str(data, "auth_token", defaults.auth_token, where),
+        )
+
+
+def _default_profiles() -> dict[str, SentryProfile]:
+    return {"default": SentryProfile()}
+
+
+@dataclass(slots=True)
+class AppConfig:
+    """Application-wide configuration with profile management.
+
+    sentry_dsn overrides the monitoring DSN (env var > config > hardcoded default).
+    """
+
+    default_profile: str = "default"
+    profiles: dict[str, SentryProfile] = field(default_factory=_default_profiles)
+    sentry_dsn: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AppConfig":
+        """Build from parsed TOML; unknown keys are ignored.
+
+        Raises ConfigurationError if a field has the wrong type.
+        """
+        raw_profiles = data.get("profiles")
+        if raw_profiles is None:
+            profiles = _default_profiles()
+        elif isinstance(raw_profiles, dict):
+            profiles = {}
+            for name, profile in raw_profiles.items():
+                if not isinstance(profile, dict):
+                    msg = f"profiles.{name} must be a table"
+                    raise ConfigurationError(msg)
+                profiles[name] = SentryProfile.from_dict(profile, name)
+        else:
+            msg = "profiles must be a table"
+            raise ConfigurationError(msg)
+
+        return cls(
+            default_profile=_str(data, "default_profile", "default", ""),
+            profiles=profiles,
+            sentry_dsn=_optional_str(data, "sentry_dsn", None, ""),
+        )
+
+
+def cache_dir() -> Path:
+    """Base directory for on-disk caches: $XDG_CACHE_HOME/sentry-tool (~/.cache by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "sentry-tool"
 
 
 def load_config(config_path: Path | None = None) -> AppConfig:
     """Search order: explicit path > ~/.config/sentry-tool/config.toml > defaults.
 
-    Returns default AppConfig if no file found.
+    Returns default AppConfig if no file found. Parsed files are cached per path
+    and modification time, so repeated calls skip re-parsing until the file changes.
     """
     search_paths = [
         Path.home() / ".config" / "sentry-tool" / "config.toml",
@@ -63,14 +120,23 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         search_paths.insert(0, config_path)
 
     for path in search_paths:
-        if path.exists():
-            with path.open("rb") as f:
-                config_data = tomllib.load(f)
-                return AppConfig(**config_data)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        return _parse_config_file(path, mtime_ns)
 
     return AppConfig()
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: Path, mtime_ns: int) -> AppConfig:
+    """mtime_ns is only part of the cache key: an edited file misses the cache."""
+    with path.open("rb") as f:
+        config_data = tomllib.load(f)
+    return AppConfig.from_dict(config_data)
+
+
 def get_profile(config: AppConfig, profile: str | None = None) -> SentryProfile:
     """Resolution order: explicit profile > SENTRY_PROFILE env > config default.
 
@@ -98,6 +164,10 @@ class EnvOverrides:
     auth_token: str | None = field(default=None)
 
 
+# EnvOverrides fields that replace the profile value of the same name when set.
+_OVERRIDE_FIELDS = ("url", "org", "project", "auth_token")
+
+
 def resolve_sentry_config(
     config: SentryProfile,
     overrides: EnvOverrides | None = None,
@@ -119,22 +189,25 @@ def resolve_sentry_config(
             auth_token=kwargs.get("env_auth_token"),
         )
 
-    auth_token = overrides.auth_token if overrides.auth_token is not None else config.auth_token
+    resolved: dict[str, Any] = {
+        "url": config.url,
+        "org": config.org,
+        "project": config.project,
+        "auth_token": config.auth_token,
+    }
+    for key in _OVERRIDE_FIELDS:
+        value = getattr(overrides, key)
+        if value is not None:
+            resolved[key] = value
+
+    # Project precedence: CLI flag > env var > profile
+    if overrides.cli_project is not None:
+        resolved["project"] = overrides.cli_project
 
+    auth_token = resolved["auth_token"]
     if not auth_token or not auth_token.strip():
         msg = "SENTRY_AUTH_TOKEN not set in profile or environment"
         raise ConfigurationError(msg)
+    resolved["auth_token"] = auth_token.strip()
 
-    # Project precedence: CLI flag > env var > profile
-    project = (
-        overrides.cli_project
-        if overrides.cli_project is not None
-        else (overrides.project if overrides.project is not None else config.project)
-    )
-
-    return {
-        "url": overrides.url if overrides.url is not None else config.url,
-        "org": overrides.org if overrides.org is not None else config.org,
-        "project": project,
-        "auth_token": auth_token.strip(),
-    }
+    return resolved
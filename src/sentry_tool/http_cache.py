@@ -0,0 +1,111 @@
+"""On-disk cache of validated API responses for conditional GET requests.
+
+Responses that carry an ETag or Last-Modified header are stored under
+$XDG_CACHE_HOME/sentry-tool/http (default ~/.cache/sentry-tool/http), keyed by
+token and URL. The next request for the same URL sends If-None-Match /
+If-Modified-Since, and a 304 reply is answered from the stored body. The
+directory keeps the MAX_ENTRIES most recently written responses.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from sentry_tool import config
+from sentry_tool.monitoring import get_logger, log_enabled
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup ("fast" extra)
+    _HAS_ORJSON = False
+
+log = get_logger("http_cache")
+
+# Cap on stored responses; the least recently written are pruned first.
+MAX_ENTRIES = 500
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    body: Any
+
+
+def cache_dir() -> Path:
+    return config.cache_dir() / "http"
+
+
+def _entry_path(url: str, token: str) -> Path:
+    key = hashlib.sha256(f"{token}\n{url}".encode()).hexdigest()
+    return cache_dir() / f"{key}.json"
+
+
+def lookup(url: str, token: str) -> CachedResponse | None:
+    try:
+        raw = _entry_path(url, token).read_bytes()
+        data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or "body" not in data:
+        return None
+    return CachedResponse(data.get("etag"), data.get("last_modified"), data["body"])
+
+
+def conditional_headers(entry: CachedResponse) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def store(url: str, token: str, response: requests.Response, body: Any) -> None:
+    """Persist body if the response carries a validator; otherwise do nothing."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    path = _entry_path(url, token)
+    entry = {"etag": etag, "last_modified": last_modified, "body": body}
+    payload = orjson.dumps(entry) if _HAS_ORJSON else json.dumps(entry).encode()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        is_new = not path.exists()
+        # mkstemp creates the file with mode 0600 and a unique name per writer.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError as exc:
+        if log_enabled(logging.DEBUG):
+            log.debug("http cache write failed", path=str(path), error=str(exc))
+        return
+    if is_new:
+        _prune(path.parent)
+
+
+def _prune(directory: Path) -> None:
+    """Drop the oldest entries once the directory holds more than MAX_ENTRIES."""
+    try:
+        entries = [(entry.stat().st_mtime, entry) for entry in directory.glob("*.json")]
+    except OSError:
+        return
+    if len(entries) <= MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, entry in entries[: len(entries) - MAX_ENTRIES]:
+        with contextlib.suppress(OSError):
+            entry.unlink()
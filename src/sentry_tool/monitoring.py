@@ -1,52 +1,115 @@
 """Monitoring setup: Sentry error tracking and structlog logging.
 
-Logging goes to stderr to keep stdout clean for data output (piping).
-Sentry is initialized after logging for self-monitoring.
+Logging goes to stderr to keep stdout clean for data output (piping): human-readable
+on a terminal, one JSON object per line otherwise.
+sentry_sdk is imported and initialized only once an unhandled exception needs reporting.
 DSN resolution order: SENTRY_DSN env var > config file sentry_dsn > hardcoded default.
+Setting SENTRY_DSN to an empty string turns error reporting off.
 """
 
+import functools
 import logging
 import os
 import sys
 from typing import Any
 
-import sentry_sdk
 import structlog
 
 from sentry_tool.__about__ import __version__
 from sentry_tool.config import load_config
 
-_LOG_LEVELS: dict[str, int] = {
-    "debug": logging.DEBUG,
-    "info": logging.INFO,
-    "warning": logging.WARNING,
-    "error": logging.ERROR,
-    "critical": logging.CRITICAL,
-}
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup ("fast" extra)
+    _HAS_ORJSON = False
+
+# Threshold installed by setup_logging; structlog's default config emits every level.
+_log_level = logging.NOTSET
 
 
 def setup_logging(verbose: bool = False) -> None:
-    log_level = "debug" if verbose else "info"
+    global _log_level  # noqa: PLW0603
+    level = logging.DEBUG if verbose else logging.INFO
+    _log_level = level
+    _bound_loggers.clear()
+
+    processors: list[Any] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+    ]
+    logger_factory: Any
+    if sys.stderr.isatty():
+        processors += [
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(colors=True),
+        ]
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stderr)
+    elif _HAS_ORJSON:
+        # orjson renders bytes, which BytesLogger writes without a text-layer round trip.
+        processors += [
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ]
+        logger_factory = structlog.BytesLoggerFactory(file=sys.stderr.buffer)
+    else:
+        processors += [
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ]
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stderr)
 
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=sys.stderr.isatty()),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVELS[log_level]),
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
+def log_enabled(level: int) -> bool:
+    """Whether a record at level would be emitted; lets call sites skip building costly fields."""
+    return level >= _log_level
+
+
+# Logger name -> bound logger, bound on first use and dropped by setup_logging().
+_bound_loggers: dict[str, Any] = {}
+
+
+class _NamedLogger:
+    """Logger named `name` that follows the structlog configuration.
+
+    Module-level loggers are created at import, before setup_logging() runs.
+    The bound logger behind each name is built on first use and rebuilt after
+    the next setup_logging(), so a later configuration still applies to them.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        bound = _bound_loggers.get(self._name)
+        if bound is None:
+            bound = structlog.get_logger().bind(logger=self._name)
+            _bound_loggers[self._name] = bound
+        return getattr(bound, attr)
+
+
+@functools.cache
+def _named_logger(name: str) -> _NamedLogger:
+    return _NamedLogger(name)
+
+
 def get_logger(name: str | None = None) -> Any:
-    logger = structlog.get_logger()
     if name:
-        logger = logger.bind(logger=name)
-    return logger
+        return _named_logger(name)
+    return structlog.get_logger()
 
 
 _DEFAULT_DSN = "https://a176b6acecc8529b8f985532d49e2e04@o4508594232426496.ingest.us.sentry.io/4510896961093633"
@@ -56,21 +119,41 @@ def resolve_dsn() -> str | None:
     """Check SENTRY_DSN env var first, then config file sentry_dsn field.
 
     Returns an override DSN if configured, or None to use the hardcoded default.
+    A set but empty SENTRY_DSN returns "" (reporting disabled) without reading
+    the config file.
     """
     dsn = os.environ.get("SENTRY_DSN")
-    if dsn:
+    if dsn is not None:
         return dsn
 
     config = load_config()
     return config.sentry_dsn
 
 
-def setup_sentry(environment: str = "local") -> None:
+def setup_sentry(environment: str = "local") -> bool:
+    """Initialize the Sentry SDK; returns False when reporting is disabled."""
+    dsn = resolve_dsn()
+    if dsn == "":
+        return False
+
+    import sentry_sdk  # noqa: PLC0415 - heavy import, only needed once a crash is reported
+
     sentry_sdk.init(
-        dsn=resolve_dsn() or _DEFAULT_DSN,
+        dsn=dsn or _DEFAULT_DSN,
         traces_sample_rate=0.03,
         environment=environment,
         release=__version__,
         attach_stacktrace=True,
         send_default_pii=False,
     )
+    return True
+
+
+def report_exception(exc: BaseException, environment: str = "local") -> None:
+    """Initialize Sentry on demand and send a single unhandled exception."""
+    if not setup_sentry(environment=environment):
+        return
+
+    import sentry_sdk  # noqa: PLC0415 - heavy import, only needed once a crash is reported
+
+    sentry_sdk.capture_exception(exc)
@@ -1,20 +1,46 @@
 """Generic output formatting for data display."""
 
+import functools
 import json
+import operator
+import sys
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup ("fast" extra)
+    _HAS_ORJSON = False
 
 
 class OutputFormat(str, Enum):
     table = "table"
     json = "json"
+    tsv = "tsv"
+
+
+# Layout matching json.dumps(indent=2); int dict keys are written as strings like the stdlib.
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if _HAS_ORJSON else 0
+
+# Styles for the event detail blocks, parsed once instead of from markup on every line.
+_BOLD = Style.parse("bold")
+_DIM = Style.parse("dim")
+_RED = Style.parse("red")
 
+# Tabs and line breaks inside a cell would split TSV fields and records.
+_TSV_ESCAPES = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Column:
     header: str
     key: str
@@ -23,27 +49,110 @@ class Column:
     max_width: int | None = None
 
 
+@functools.cache
+def get_console(stderr: bool = False) -> Console:
+    """Shared Console for stdout (or stderr), created on first use.
+
+    Console probes the terminal when constructed, so commands reuse one
+    instance instead of building a new one per message. When the stream is
+    not a terminal (piped or redirected), highlighting and soft wrapping of
+    printed text are turned off so output is plain and lines stay whole.
+    """
+    console = Console(stderr=stderr)
+    if console.is_terminal:
+        return console
+    return Console(stderr=stderr, no_color=True, highlight=False, soft_wrap=True)
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize to 2-space indented JSON, using orjson when it is installed.
+
+    Both paths produce the same text: non-ASCII characters are written as-is,
+    and integers beyond orjson's 64-bit range fall back to the stdlib encoder.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def print_json(data: Any) -> None:
+    """Print data as indented JSON to stdout.
+
+    The UTF-8 encoded bytes go straight to the stdout buffer, skipping the
+    re-encode that print() would do on large payloads.
+    """
+    payload = _json_line(data)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(payload.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+def _json_line(data: Any) -> bytes:
+    """dumps_json output plus a newline, as UTF-8 bytes."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode()
+
+
 def render(
     data: list[dict[str, Any]],
     format: OutputFormat,
-    columns: list[Column] | None = None,
+    columns: Sequence[Column] | None = None,
     footer: str | None = None,
 ) -> None:
     """Render list data as JSON or Rich table.
 
     For JSON: prints indented JSON to stdout.
     For table: builds a Rich table using column specs for styling (max_width, justify, style).
+    For TSV: writes a header line and one tab-separated line per row, bypassing Rich.
     The footer (e.g. "Showing 5 issues") is only printed in table mode.
     """
     if format == OutputFormat.json:
-        print(json.dumps(data, indent=2))
+        print_json(data)
         return
 
-    console = Console()
+    if format == OutputFormat.tsv:
+        write_tsv(data, columns)
+        return
 
     if not data:
         return
 
+    table = build_table(data, columns)
+    # One print call: Rich renders the table and footer together and writes once.
+    get_console().print(Group(table, f"\n{footer}") if footer else table)
+
+
+def write_tsv(data: list[dict[str, Any]], columns: Sequence[Column] | None = None) -> None:
+    """Write rows as tab-separated text with a header line; nothing for empty data."""
+    if not data:
+        return
+    if columns is None:
+        columns = [Column(header=key, key=key) for key in data[0]]
+
+    keys = [col.key for col in columns]
+    sys.stdout.write("\t".join(col.header for col in columns) + "\n")
+    sys.stdout.writelines(
+        "\t".join(str(row.get(key, "")).translate(_TSV_ESCAPES) for key in keys) + "\n"
+        for row in data
+    )
+
+
+def build_table(data: list[dict[str, Any]], columns: Sequence[Column] | None = None) -> Table:
+    """Rich table for non-empty row data, styled by column specs; columns default to row keys.
+
+    Lets callers combine several tables into one renderable instead of printing each.
+    """
     if columns is None:
         columns = [Column(header=key, key=key) for key in data[0]]
 
@@ -58,44 +167,61 @@ def render(
             kwargs["max_width"] = col.max_width
         table.add_column(col.header, **kwargs)
 
+    keys = tuple(col.key for col in columns)
+    get_values = _row_getter(keys)
     for row in data:
-        values = [str(row.get(col.key, "")) for col in columns]
-        table.add_row(*values)
+        try:
+            values = get_values(row)
+        except KeyError:
+            values = tuple(row.get(key, "") for key in keys)
+        table.add_row(*map(str, values))
+
+    return table
+
 
-    console.print(table)
-    if footer:
-        console.print(f"\n{footer}")
+def _row_getter(keys: tuple[str, ...]) -> Callable[[dict[str, Any]], tuple[Any, ...]]:
+    """Fetch all cell values of a row in one call; raises KeyError if a key is missing."""
+    if len(keys) > 1:
+        return operator.itemgetter(*keys)
+    return lambda row: tuple(row[key] for key in keys)
 
 
 # Event-specific formatting helpers (used by `events event` command for Rich detail view)
 
 
 def print_event_context(console: Console, ctx: dict[str, Any]) -> None:
-    console.print("\n[bold]Context:[/bold]")
+    text = Text.assemble("\n", ("Context:", _BOLD))
     if "caller" in ctx:
-        console.print(f"  [dim]Caller:[/dim] {ctx['caller']}")
+        text.append("\n  ").append("Caller:", _DIM)
+        text.append_text(console.render_str(f" {ctx['caller']}", markup=False))
     if "stack" in ctx:
-        console.print("  [dim]Stack:[/dim]")
+        text.append("\n  ").append("Stack:", _DIM)
         for line in ctx["stack"].split("\n"):
-            console.print(f"    {line}")
+            text.append_text(console.render_str(f"\n    {line}", markup=False))
+    console.print(text)
 
 
 def print_exception_entry(console: Console, data: dict[str, Any]) -> None:
-    console.print("\n[bold]Exception:[/bold]")
+    # One Text for the whole block: styles are pre-parsed and event data is
+    # never read as markup, only highlighted the way console.print would.
+    text = Text.assemble("\n", ("Exception:", _BOLD))
     for exc in data.get("values", []):
         exc_type = exc.get("type", "Exception")
         exc_value = exc.get("value", "")
-        console.print(f"  [red]{exc_type}[/red]: {exc_value}")
+        text.append("\n  ").append(str(exc_type), _RED)
+        text.append_text(console.render_str(f": {exc_value}", markup=False))
 
         stacktrace = exc.get("stacktrace") or {}
         frames = stacktrace.get("frames", []) if stacktrace else []
         if frames:
-            console.print("  [dim]Stacktrace:[/dim]")
-            for frame in frames[-5:]:
-                filename = frame.get("filename", "")
-                lineno = frame.get("lineNo", "")
-                function = frame.get("function", "")
-                console.print(f"    {filename}:{lineno} in {function}")
+            text.append("\n  ").append("Stacktrace:", _DIM)
+            lines = "".join(
+                f"\n    {frame.get('filename', '')}:{frame.get('lineNo', '')}"
+                f" in {frame.get('function', '')}"
+                for frame in frames[-5:]
+            )
+            text.append_text(console.render_str(lines, markup=False))
+    console.print(text)
 
 
 def render_event_basic_info(console: Console, event: dict[str, Any], short_id: str) -> None:
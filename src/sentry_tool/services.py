@@ -1,16 +1,88 @@
 """Business logic for Sentry API interactions."""
 
+import json
+import logging
+import os
+from pathlib import Path
 from typing import Any
 
+from sentry_tool.config import cache_dir
+from sentry_tool.monitoring import get_logger, log_enabled
 from sentry_tool.utils import api
 
+# Cap on cached issue ID keys (up to three per issue); the oldest are dropped first.
+MAX_CACHED_ISSUE_IDS = 3000
+
+# Issue ID -> (numeric ID, short ID) per cache file, loaded at most once per process.
+_resolved_ids: dict[Path, dict[str, list[str]]] = {}
+
+
+def _issue_id_cache_path() -> Path:
+    return cache_dir() / "shortid_map.json"
+
+
+def _load_issue_ids(path: Path) -> dict[str, list[str]]:
+    if path not in _resolved_ids:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        _resolved_ids[path] = data if isinstance(data, dict) else {}
+    return _resolved_ids[path]
+
+
+def _save_issue_ids(path: Path, mapping: dict[str, list[str]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        tmp = path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(mapping))
+        os.replace(tmp, path)
+    except OSError as exc:
+        if log_enabled(logging.DEBUG):
+            get_logger("services").debug("issue id cache write failed", error=str(exc))
+
 
 def resolve_issue_to_numeric(config: dict[str, Any], issue_id: str) -> tuple[str, str]:
-    issue = api(
-        f"/organizations/{config['org']}/issues/{issue_id}/",
-        token=config["auth_token"],
-        base_url=config["url"],
+    """Map a numeric or short issue ID to (numeric_id, short_id).
+
+    Results are cached on disk per Sentry URL and org; both IDs of an issue are
+    stable, so later invocations skip the lookup request. The cache keeps the
+    most recent MAX_CACHED_ISSUE_IDS keys.
+    """
+    path = _issue_id_cache_path()
+    mapping = _load_issue_ids(path)
+    prefix = f"{config['url']}|{config['org']}|"
+    cached = mapping.get(prefix + issue_id)
+    if cached:
+        return cached[0], cached[1]
+
+    issue = (
+        api(
+            f"/organizations/{config['org']}/issues/{issue_id}/",
+            token=config["auth_token"],
+            base_url=config["url"],
+        )
+        or {}
     )
-    numeric_id = issue.get("id", issue_id)
+    numeric_id = str(issue.get("id", issue_id))
     short_id = issue.get("shortId", issue_id)
-    return str(numeric_id), short_id
+
+    entry = [numeric_id, short_id]
+    mapping[prefix + issue_id] = entry
+    mapping[prefix + numeric_id] = entry
+    mapping[prefix + short_id] = entry
+    # Dicts keep insertion order, so the first keys are the oldest resolutions.
+    for stale in list(mapping)[: max(0, len(mapping) - MAX_CACHED_ISSUE_IDS)]:
+        del mapping[stale]
+    _save_issue_ids(path, mapping)
+    return numeric_id, short_id
+
+
+def issue_numeric_id(config: dict[str, Any], issue_id: str) -> str:
+    """Numeric ID for an issue, resolving short IDs only; numeric input needs no request."""
+    if issue_id.isdigit():
+        return issue_id
+    numeric_id, _short_id = resolve_issue_to_numeric(config, issue_id)
+    return numeric_id
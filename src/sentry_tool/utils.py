@@ -4,7 +4,6 @@ import os
 from typing import Any
 
 import typer
-from rich.console import Console
 
 from sentry_tool.client import NotFoundError, api_call
 from sentry_tool.config import (
@@ -17,9 +16,14 @@ from sentry_tool.config import (
 )
 from sentry_tool.exceptions import ConfigurationError
 from sentry_tool.monitoring import get_logger
+from sentry_tool.output import get_console
+
+log = get_logger("cli")
 
 _active_profile: str | None = None
 _active_project: str | None = None
+# (parsed config, (profile flag, SENTRY_PROFILE, overrides), resolved settings)
+_resolved: tuple[AppConfig, tuple[Any, ...], dict[str, Any]] | None = None
 
 
 def mask_token(token: str | None) -> str:
@@ -45,27 +49,47 @@ def get_config() -> dict[str, Any]:
     3. SENTRY_PROFILE environment variable
     4. default_profile in config file
     5. Environment variables (SENTRY_URL, SENTRY_ORG, SENTRY_PROJECT, SENTRY_AUTH_TOKEN)
+
+    The last resolution is reused while the parsed config file, CLI flags and
+    environment are unchanged; callers get their own copy of the dict.
     """
     try:
-        app_config: AppConfig = load_config()
-        profile_config: SentryProfile = get_profile(app_config, _active_profile)
-
-        overrides = EnvOverrides(
-            cli_project=_active_project,
-            url=os.environ.get("SENTRY_URL"),
-            org=os.environ.get("SENTRY_ORG"),
-            project=os.environ.get("SENTRY_PROJECT"),
-            auth_token=os.environ.get("SENTRY_AUTH_TOKEN"),
-        )
-        resolved = resolve_sentry_config(profile_config, overrides)
-        return resolved
+        return _resolve_config()
     except ConfigurationError as exc:
-        Console().print(f"[red]Error: {exc}[/red]")
+        get_console().print(f"[red]Error: {exc}[/red]")
         raise typer.Exit(1) from None
 
 
+def find_config() -> dict[str, Any] | None:
+    """Like get_config, but returns None instead of reporting a configuration error."""
+    try:
+        return _resolve_config()
+    except ConfigurationError:
+        return None
+
+
+def _resolve_config() -> dict[str, Any]:
+    global _resolved  # noqa: PLW0603
+    app_config: AppConfig = load_config()
+    environ = os.environ
+    overrides = EnvOverrides(
+        cli_project=_active_project,
+        url=environ.get("SENTRY_URL"),
+        org=environ.get("SENTRY_ORG"),
+        project=environ.get("SENTRY_PROJECT"),
+        auth_token=environ.get("SENTRY_AUTH_TOKEN"),
+    )
+    key = (_active_profile, environ.get("SENTRY_PROFILE"), overrides)
+    if _resolved is not None and _resolved[0] is app_config and _resolved[1] == key:
+        return dict(_resolved[2])
+
+    profile_config: SentryProfile = get_profile(app_config, _active_profile)
+    resolved = resolve_sentry_config(profile_config, overrides)
+    _resolved = (app_config, key, resolved)
+    return dict(resolved)
+
+
 def api(endpoint: str, token: str, base_url: str) -> Any:
-    log = get_logger("cli")
     try:
         return api_call(endpoint, token=token, base_url=base_url)
     except NotFoundError:
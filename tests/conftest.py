@@ -2,13 +2,74 @@ import os
 
 import pytest
 
-from sentry_tool.client import api_call
+from sentry_tool.client import api_call, clear_response_cache
 from sentry_tool.config import get_profile, load_config, resolve_sentry_config
 from sentry_tool.monitoring import setup_logging
 
 # Configure structlog once for the test session so log.error() writes to stderr
 setup_logging()
 
+STAGING_PROD_CONFIG = """
+default_profile = "staging"
+
+[profiles.staging]
+url = "https://sentry-staging.test.local"
+org = "staging-org"
+project = "staging-project"
+auth_token = "staging_token_abcd"
+
+[profiles.prod]
+url = "https://sentry-prod.test.local"
+org = "prod-org"
+project = "prod-project"
+auth_token = "prod_token"
+"""  # pragma: allowlist secret
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Point on-disk caches at a fresh directory and drop in-memory responses between tests."""
+    cache_home = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    # The shell turns the in-memory response cache on for the rest of the process.
+    monkeypatch.setattr("sentry_tool.client._response_cache_enabled", False)
+    clear_response_cache()
+    return cache_home / "sentry-tool"
+
+
+@pytest.fixture
+def clean_sentry_env(monkeypatch):
+    """Unset the SENTRY_* variables that override profile settings."""
+    for var in (
+        "SENTRY_PROFILE",
+        "SENTRY_URL",
+        "SENTRY_ORG",
+        "SENTRY_PROJECT",
+        "SENTRY_AUTH_TOKEN",
+    ):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture(scope="session")
+def config_home(tmp_path_factory):
+    """Return a HOME holding the given config.toml body, written once per distinct body.
+
+    Tests that share a body share the directory (and load_config's parse cache),
+    so they must not modify it.
+    """
+    homes = {}
+
+    def make(text):
+        if text not in homes:
+            home = tmp_path_factory.mktemp("config_home")
+            config_file = home / ".config" / "sentry-tool" / "config.toml"
+            config_file.parent.mkdir(parents=True)
+            config_file.write_text(text)
+            homes[text] = home
+        return homes[text]
+
+    return make
+
 
 @pytest.fixture(scope="session")
 def live_config():
@@ -151,10 +212,19 @@ def live_cli_env(live_config, monkeypatch):
     monkeypatch.setenv("SENTRY_AUTH_TOKEN", live_config["auth_token"])
 
 
+# ===== Synthetic config for profile resolution tests =====
+
+
+@pytest.fixture(scope="session")
+def staging_home(config_home):
+    """HOME holding one config with a default 'staging' profile and a 'prod' profile."""
+    return config_home(STAGING_PROD_CONFIG)
+
+
 # ===== Synthetic fixtures for span tree unit tests =====
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transaction_spans():
     base_time = 1705319400.0
     return {
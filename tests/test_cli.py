@@ -1,34 +1,77 @@
+import json
+import os
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
+from sentry_tool import services
 from sentry_tool.__about__ import __version__
 from sentry_tool.cli import app
 from sentry_tool.config import (
+    AppConfig,
     EnvOverrides,
+    SentryProfile,
     get_profile,
     load_config,
     resolve_sentry_config,
 )
 from sentry_tool.exceptions import ConfigurationError
 
-runner = CliRunner()
+runner = CliRunner(catch_exceptions=False)
 
 
 # ===== Tests for --version flag =====
 
 
-def test_version_flag():
-    result = runner.invoke(app, ["--version"])
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_version_flag(flag):
+    result = runner.invoke(app, [flag])
     assert result.exit_code == 0
     assert f"sentry-tool {__version__}" in result.stdout
 
 
-def test_version_short_flag():
-    result = runner.invoke(app, ["-V"])
+def test_version_flag_does_not_import_commands():
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from sentry_tool.cli import app\n"
+        "CliRunner().invoke(app, ['--version'])\n"
+        "print(sorted(m for m in sys.modules if m.startswith('sentry_tool.commands.')))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_commands_package_loads_submodules_on_attribute_access():
+    script = (
+        "import sys\n"
+        "import sentry_tool.commands as commands\n"
+        "commands.issues\n"
+        "print(sorted(m for m in sys.modules if m.startswith('sentry_tool.commands.')))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "['sentry_tool.commands.issues']"
+
+
+def test_help_lists_lazy_commands():
+    result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
-    assert f"sentry-tool {__version__}" in result.stdout
+    for command in ("transactions", "trace", "transaction", "spans"):
+        assert command in result.stdout
+
+
+def test_unknown_command_fails():
+    result = runner.invoke(app, ["no-such-command"])
+    assert result.exit_code == 2
 
 
 # ===== Tests for list command =====
@@ -47,6 +90,32 @@ def test_list_issues_with_status_filter(live_cli_env):
     assert result.exit_code == 0
 
 
+def test_list_all_projects_adds_project_column(monkeypatch):
+    issues = [
+        {
+            "id": "1",
+            "shortId": "WEB-1",
+            "status": "unresolved",
+            "level": "error",
+            "count": "3",
+            "title": "Boom",
+            "project": {"slug": "web"},
+        }
+    ]
+    monkeypatch.setattr("sentry_tool.commands.issues.api", lambda *a, **kw: issues)
+    monkeypatch.setattr(
+        "sentry_tool.commands.issues.get_config",
+        lambda: {"url": "https://s.test", "org": "o", "project": "p", "auth_token": "t"},
+    )
+
+    with_project = runner.invoke(app, ["list", "-A"])
+    without_project = runner.invoke(app, ["list"])
+
+    assert "Project" in with_project.stdout
+    assert "web" in with_project.stdout
+    assert "Project" not in without_project.stdout
+
+
 # ===== Tests for show command =====
 
 
@@ -80,9 +149,103 @@ def test_show_event_raw_json(live_cli_env, live_issue_id):
     assert '"eventID"' in result.stdout
 
 
+@pytest.fixture
+def mock_event_api(monkeypatch):
+    """Stub config and API for event commands, recording every requested endpoint."""
+    calls = []
+
+    def fake_api(endpoint, token, base_url):
+        calls.append(endpoint)
+        if endpoint.endswith("/events/"):
+            return [
+                {
+                    "eventID": "evt123",
+                    "dateCreated": "2024-01-15T10:30:00.123456Z",
+                    "tags": [
+                        {"key": "level", "value": "error"},
+                        {"key": "server_name", "value": "web-01"},
+                    ],
+                },
+                {"eventID": "evt456", "dateCreated": "2024-01-15T10:31:00Z"},
+            ]
+        if "/events/" in endpoint:
+            return {"eventID": "evt123", "title": "Boom"}
+        return {"id": "42", "shortId": "PROJ-1A"}
+
+    def fake_get_config():
+        return {
+            "url": "https://sentry.test",
+            "org": "test-org",
+            "project": "test-proj",
+            "auth_token": "test-token",  # pragma: allowlist secret
+        }
+
+    monkeypatch.setattr("sentry_tool.commands.events.api", fake_api)
+    monkeypatch.setattr("sentry_tool.services.api", fake_api)
+    monkeypatch.setattr("sentry_tool.commands.events.get_config", fake_get_config)
+    return calls
+
+
+def test_show_event_numeric_id_fetches_event_directly(mock_event_api):
+    result = runner.invoke(app, ["event", "42"])
+
+    assert result.exit_code == 0
+    assert "/organizations/test-org/issues/42/events/latest/" in mock_event_api
+    assert "PROJ-1A" in result.stdout
+
+
+def test_show_event_short_id_resolves_first(mock_event_api):
+    result = runner.invoke(app, ["event", "PROJ-1A", "-e", "evt123"])
+
+    assert result.exit_code == 0
+    assert mock_event_api == [
+        "/organizations/test-org/issues/PROJ-1A/",
+        "/organizations/test-org/issues/42/events/evt123/",
+    ]
+
+
+def test_short_id_resolution_is_cached_on_disk(mock_event_api, isolated_cache_dir):
+    runner.invoke(app, ["event", "PROJ-1A", "-e", "evt123"])
+    mock_event_api.clear()
+    services._resolved_ids.clear()
+
+    result = runner.invoke(app, ["event", "PROJ-1A", "-e", "evt123"])
+
+    assert result.exit_code == 0
+    assert mock_event_api == ["/organizations/test-org/issues/42/events/evt123/"]
+    assert (isolated_cache_dir / "shortid_map.json").exists()
+
+
+def test_short_id_cache_is_private_and_capped(mock_event_api, isolated_cache_dir, monkeypatch):
+    monkeypatch.setattr(services, "MAX_CACHED_ISSUE_IDS", 2)
+    services._resolved_ids.clear()
+    path = isolated_cache_dir / "shortid_map.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"https://old.test|org|OLD-1": ["1", "OLD-1"]}))
+
+    runner.invoke(app, ["event", "PROJ-1A", "-e", "evt123"])
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert list(json.loads(path.read_text())) == [
+        "https://sentry.test|test-org|PROJ-1A",
+        "https://sentry.test|test-org|42",
+    ]
+
+
 # ===== Tests for events command =====
 
 
+def test_list_events_extracts_server_tag(mock_event_api):
+    result = runner.invoke(app, ["events", "42", "--format", "json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == [
+        {"eventID": "evt123", "date": "2024-01-15T10:30:00", "server": "web-01"},
+        {"eventID": "evt456", "date": "2024-01-15T10:31:00", "server": "-"},
+    ]
+    assert mock_event_api == ["/organizations/test-org/issues/42/events/"]
+
+
 def test_list_events(live_cli_env, live_issue_id):
     result = runner.invoke(app, ["events", live_issue_id])
 
@@ -107,18 +270,8 @@ def test_show_tags_detail(live_cli_env, live_issue_id, live_tag_key):
 # ===== Tests for profile config resolution =====
 
 
-def test_profile_resolution_by_name(tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token_123"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_profile_resolution_by_name(staging_home, monkeypatch):
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config, "staging")
@@ -129,102 +282,38 @@ auth_token = "staging_token_123"
     assert resolved["project"] == "staging-project"
 
 
-def test_profile_from_env_var(tmp_path, monkeypatch):
-    monkeypatch.setenv("SENTRY_PROFILE", "staging")
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token_123"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_profile_from_env_var(staging_home, monkeypatch):
+    # The shared config defaults to staging, so the env var must select prod.
+    monkeypatch.setenv("SENTRY_PROFILE", "prod")
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config)
     resolved = resolve_sentry_config(profile)
 
-    assert resolved["url"] == "https://sentry-staging.test.local"
+    assert resolved["url"] == "https://sentry-prod.test.local"
 
 
-def test_profile_explicit_overrides_env(tmp_path, monkeypatch):
+def test_profile_explicit_overrides_env(staging_home, monkeypatch):
     monkeypatch.setenv("SENTRY_PROFILE", "staging")
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-auth_token = "staging_token"
-
-[profiles.prod]
-url = "https://sentry-prod.test.local"
-auth_token = "prod_token"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config, profile="prod")
     assert profile.url == "https://sentry-prod.test.local"
 
 
-def test_default_profile_used_when_none_specified(tmp_path, monkeypatch):
+def test_default_profile_used_when_none_specified(staging_home, monkeypatch):
     monkeypatch.delenv("SENTRY_PROFILE", raising=False)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-default_profile = "staging"
-
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-auth_token = "staging_token"
-
-[profiles.prod]
-url = "https://sentry-prod.test.local"
-auth_token = "prod_token"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config)
     assert profile.url == "https://sentry-staging.test.local"
 
 
-def test_invalid_profile_name_raises_error(tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.prod]
-url = "https://sentry-prod.test.local"
-auth_token = "prod_token"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
-
-    app_config = load_config()
-    with pytest.raises(ConfigurationError, match="nonexistent"):
-        get_profile(app_config, profile="nonexistent")
-
-
-def test_env_url_overrides_profile(tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_env_url_overrides_profile(staging_home, monkeypatch):
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config, "staging")
@@ -252,81 +341,48 @@ def test_env_vars_only_no_config(tmp_path, monkeypatch):
     assert resolved["auth_token"] == "test_token_12345"
 
 
-def test_missing_auth_token_raises_error(tmp_path, monkeypatch):
+@pytest.mark.parametrize(
+    ("profile_name", "match"),
+    [
+        pytest.param("nonexistent", "nonexistent", id="unknown-profile"),
+        pytest.param("staging", "SENTRY_AUTH_TOKEN", id="missing-auth-token"),
+    ],
+)
+def test_config_resolution_errors(monkeypatch, profile_name, match):
     monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
     monkeypatch.delenv("SENTRY_PROFILE", raising=False)
+    app_config = AppConfig(
+        default_profile="staging",
+        profiles={
+            "staging": SentryProfile(
+                url="https://sentry-staging.test.local",
+                org="staging-org",
+                project="staging-project",
+            )
+        },
+    )
 
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-""")
-
-    monkeypatch.setenv("HOME", str(tmp_path))
-
-    app_config = load_config()
-    profile = get_profile(app_config, "staging")
-    with pytest.raises(ConfigurationError, match="SENTRY_AUTH_TOKEN"):
-        resolve_sentry_config(profile)
-
+    with pytest.raises(ConfigurationError, match=match):
+        resolve_sentry_config(get_profile(app_config, profile_name))
 
-def test_project_override_via_cli(tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.default]
-url = "https://sentry.test.local"
-org = "test-org"
-project = "profile-project"
-auth_token = "test_token"
-""")  # pragma: allowlist secret
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+@pytest.mark.parametrize(
+    "env_project",
+    [pytest.param("env-project", id="beats-env"), pytest.param(None, id="beats-profile")],
+)
+def test_project_override_via_cli(staging_home, monkeypatch, env_project):
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config)
-    overrides = EnvOverrides(cli_project="cli-project", project="env-project")
+    overrides = EnvOverrides(cli_project="cli-project", project=env_project)
     resolved = resolve_sentry_config(profile, overrides)
 
     assert resolved["project"] == "cli-project"
 
 
-def test_project_override_beats_profile(tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.default]
-url = "https://sentry.test.local"
-org = "test-org"
-project = "profile-project"
-auth_token = "test_token"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
-
-    app_config = load_config()
-    profile = get_profile(app_config)
-    overrides = EnvOverrides(cli_project="cli-project")
-    resolved = resolve_sentry_config(profile, overrides)
-
-    assert resolved["project"] == "cli-project"
-
-
-def test_project_with_profile_selection(tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.prod]
-url = "https://sentry-prod.test.local"
-org = "prod-org"
-project = "prod-project"
-auth_token = "prod_token"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_project_with_profile_selection(staging_home, monkeypatch):
+    monkeypatch.setenv("HOME", str(staging_home))
 
     app_config = load_config()
     profile = get_profile(app_config, "prod")
@@ -357,7 +413,7 @@ def test_list_projects_raw_json(live_cli_env):
 # ===== Tests for open command =====
 
 
-@patch("sentry_tool.commands.projects.webbrowser.open")
+@patch("webbrowser.open")
 def test_open_dashboard(mock_open, live_cli_env):
     result = runner.invoke(app, ["open"])
 
@@ -366,7 +422,7 @@ def test_open_dashboard(mock_open, live_cli_env):
     assert "Opened:" in result.stdout
 
 
-@patch("sentry_tool.commands.projects.webbrowser.open")
+@patch("webbrowser.open")
 def test_open_specific_issue(mock_open, live_cli_env):
     result = runner.invoke(app, ["open", "24"])
 
@@ -389,3 +445,78 @@ def test_list_all_projects_mutually_exclusive_with_project(live_cli_env):
 
     assert result.exit_code == 1
     assert "mutually exclusive" in result.stdout
+
+
+def test_list_mutually_exclusive_check_skips_config_load():
+    with patch("sentry_tool.commands.issues.get_config") as get_config:
+        result = runner.invoke(app, ["list", "-A", "-p", "some-project"])
+
+    assert result.exit_code == 1
+    assert "mutually exclusive" in result.stdout
+    get_config.assert_not_called()
+
+
+# ===== Tests for shell command =====
+
+
+def test_shell_runs_commands_until_exit(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
+
+    result = runner.invoke(app, ["shell"], input="config profiles\n\nexit\nconfig profiles\n")
+
+    assert result.exit_code == 0
+    assert result.stdout.count("1 profiles") == 1
+
+
+def test_shell_survives_bad_command(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    result = runner.invoke(app, ["shell"], input="no-such-command\nconfig profiles\n")
+
+    assert result.exit_code == 0
+    assert "1 profiles" in result.stdout
+
+
+def test_shell_applies_global_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
+
+    result = runner.invoke(app, ["-P", "missing", "shell"], input="config token\n")
+
+    assert result.exit_code == 0
+    assert "Profile 'missing' not found" in result.stdout
+
+
+def test_shell_enables_response_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    with patch("sentry_tool.commands.shell.enable_response_cache") as enable:
+        result = runner.invoke(app, ["shell"], input="exit\n")
+
+    assert result.exit_code == 0
+    enable.assert_called_once()
+
+
+def test_shell_warms_up_connection_when_configured(staging_home, monkeypatch):
+    monkeypatch.setenv("HOME", str(staging_home))
+    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
+
+    with patch("sentry_tool.commands.shell.threading.Thread") as thread:
+        result = runner.invoke(app, ["shell"], input="exit\n")
+
+    assert result.exit_code == 0
+    assert thread.call_args.kwargs["args"] == ("https://sentry-staging.test.local",)
+    thread.return_value.start.assert_called_once()
+
+
+def test_shell_skips_warmup_without_config(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
+
+    with patch("sentry_tool.commands.shell.threading.Thread") as thread:
+        result = runner.invoke(app, ["shell"], input="exit\n")
+
+    assert result.exit_code == 0
+    assert "Error" not in result.stdout
+    thread.assert_not_called()
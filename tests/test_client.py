@@ -1,8 +1,22 @@
 """Tests for Sentry API client with retry logic."""
 
+import importlib.util
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
 import pytest
+import requests
 
-from sentry_tool.client import NotFoundError, api_call
+from sentry_tool import client, http_cache
+from sentry_tool.client import (
+    _SESSION,
+    NotFoundError,
+    api_call,
+    enable_response_cache,
+    warmup,
+)
 
 MAX_RETRY_ATTEMPTS = 3
 
@@ -16,6 +30,24 @@ def test_api_call_success(live_config):
     assert isinstance(result, list)
 
 
+def test_api_call_concurrent_requests(live_config):
+    org = live_config["org"]
+    endpoints = [f"/organizations/{org}/projects/", f"/organizations/{org}/teams/"]
+
+    # Concurrent calls share the session's pooled connections to the live host.
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        results = list(
+            executor.map(
+                lambda endpoint: api_call(
+                    endpoint, token=live_config["auth_token"], base_url=live_config["url"]
+                ),
+                endpoints,
+            )
+        )
+
+    assert all(isinstance(result, list) for result in results)
+
+
 def test_api_call_404_raises_not_found(live_config):
     with pytest.raises(NotFoundError):
         api_call(
@@ -25,6 +57,280 @@ def test_api_call_404_raises_not_found(live_config):
         )
 
 
-def test_api_call_has_retry_decorator():
-    assert hasattr(api_call, "retry")
-    assert api_call.retry.stop.max_attempt_number == MAX_RETRY_ATTEMPTS
+def test_api_call_retries_request_errors_with_backoff():
+    error = requests.exceptions.ConnectionError("boom")
+
+    with (
+        patch.object(_SESSION, "get", side_effect=error) as mock_get,
+        patch("sentry_tool.client.time.sleep") as mock_sleep,
+        patch("sentry_tool.client.random.uniform", side_effect=lambda low, high: high),
+        pytest.raises(requests.exceptions.ConnectionError),
+    ):
+        api_call("/projects/", token="tok", base_url="https://s.test")
+
+    assert mock_get.call_count == MAX_RETRY_ATTEMPTS
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4]
+
+
+def test_api_call_backoff_is_jittered_below_cap():
+    error = requests.exceptions.Timeout("slow")
+
+    with (
+        patch.object(_SESSION, "get", side_effect=error),
+        patch("sentry_tool.client.time.sleep") as mock_sleep,
+        patch("sentry_tool.client.MAX_ATTEMPTS", 6),
+        pytest.raises(requests.exceptions.Timeout),
+    ):
+        api_call("/projects/", token="tok", base_url="https://s.test")
+
+    waits = [c.args[0] for c in mock_sleep.call_args_list]
+    ceilings = [2, 4, 8, 10, 10]
+    assert all(0 <= wait <= cap for wait, cap in zip(waits, ceilings, strict=True))
+
+
+@pytest.mark.parametrize(
+    ("status", "attempts"), [(503, MAX_RETRY_ATTEMPTS), (429, MAX_RETRY_ATTEMPTS), (401, 1)]
+)
+def test_api_call_retries_only_transient_http_errors(status, attempts):
+    response = _response(status, body={"detail": "nope"})
+    response.raise_for_status.side_effect = requests.HTTPError(f"{status}", response=response)
+
+    with (
+        patch.object(_SESSION, "get", return_value=response) as mock_get,
+        patch("sentry_tool.client.time.sleep"),
+        pytest.raises(requests.HTTPError, match="nope"),
+    ):
+        api_call("/projects/", token="tok", base_url="https://s.test")
+
+    assert mock_get.call_count == attempts
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [("5", 5), ("120", 60), ("soon", 0), ("Wed, 21 Oct 2015 07:28:00 GMT", 0)],
+)
+def test_api_call_respects_retry_after(retry_after, expected):
+    limited = _response(429, headers={"Retry-After": retry_after})
+    limited.raise_for_status.side_effect = requests.HTTPError("429", response=limited)
+    ok = _response(200, body={"ok": True})
+
+    with (
+        patch.object(_SESSION, "get", side_effect=[limited, ok]),
+        patch("sentry_tool.client.time.sleep") as mock_sleep,
+        patch("sentry_tool.client.random.uniform", return_value=0),
+    ):
+        result = api_call("/projects/", token="tok", base_url="https://s.test")
+
+    assert result == {"ok": True}
+    mock_sleep.assert_called_once_with(expected)
+
+
+def test_api_call_does_not_retry_not_found():
+    with (
+        patch.object(_SESSION, "get", return_value=_response(404)) as mock_get,
+        patch("sentry_tool.client.time.sleep") as mock_sleep,
+        pytest.raises(NotFoundError),
+    ):
+        api_call("/projects/", token="tok", base_url="https://s.test")
+
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def _response(status_code, body=None, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.json.return_value = body
+    response.content = json.dumps(body).encode()
+    return response
+
+
+def test_api_call_uses_shared_session():
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = [{"slug": "proj"}]
+
+    with patch.object(_SESSION, "get", return_value=response) as mock_get:
+        result = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+
+    assert result == [{"slug": "proj"}]
+    mock_get.assert_called_once()
+    assert mock_get.call_args.args[0] == "https://s.test/api/0/organizations/org/projects/"
+    assert mock_get.call_args.kwargs["headers"] == {"Authorization": "Bearer tok"}
+
+
+@pytest.mark.parametrize("base_url", ["https://s.test", "https://s.test/"])
+def test_api_call_joins_base_url_and_endpoint(base_url):
+    with patch.object(_SESSION, "get", return_value=_response(200, [])) as mock_get:
+        api_call("/organizations/org/projects/", token="tok", base_url=base_url)
+
+    assert mock_get.call_args.args[0] == "https://s.test/api/0/organizations/org/projects/"
+
+
+def test_api_call_reuses_read_only_auth_headers():
+    with patch.object(_SESSION, "get", return_value=_response(200, {"id": "1"})) as mock_get:
+        api_call("/organizations/org/issues/1/", token="tok", base_url="https://s.test")
+        api_call("/organizations/org/issues/2/", token="tok", base_url="https://s.test")
+
+    first, second = (c.kwargs["headers"] for c in mock_get.call_args_list)
+    assert first is second
+    with pytest.raises(TypeError):
+        first["Authorization"] = "Bearer other"
+
+
+@pytest.fixture
+def response_cache():
+    """Turn on the in-memory response cache, as the shell does; conftest turns it off again."""
+    enable_response_cache()
+
+
+def test_api_call_does_not_keep_responses_by_default():
+    with patch.object(_SESSION, "get", return_value=_response(200, [])) as mock_get:
+        api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+        api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+
+    assert mock_get.call_count == 2
+    assert not client._recent_responses
+
+
+def test_api_call_reuses_response_within_ttl(response_cache):
+    with (
+        patch.object(_SESSION, "get", return_value=_response(200, [{"slug": "proj"}])) as mock_get,
+        patch("sentry_tool.client.time.monotonic", side_effect=[100.0, 110.0, 200.0, 200.0]),
+    ):
+        first = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+        second = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+        expired = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+
+    assert first == second
+    assert first is not second
+    assert expired == first
+    assert mock_get.call_count == 2
+
+
+def test_api_call_cached_response_is_not_shared(response_cache):
+    with patch.object(_SESSION, "get", return_value=_response(200, [{"slug": "proj"}])):
+        first = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+        first.pop()
+        second = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+
+    assert second == [{"slug": "proj"}]
+
+
+def test_api_call_without_cache_always_requests(response_cache):
+    with patch.object(_SESSION, "get", return_value=_response(200, [])) as mock_get:
+        api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+        api_call(
+            "/organizations/org/projects/", token="tok", base_url="https://s.test", cache=False
+        )
+
+    assert mock_get.call_count == 2
+
+
+def test_api_call_refresh_of_cached_key_keeps_other_entries(response_cache, monkeypatch):
+    monkeypatch.setattr("sentry_tool.client.RESPONSE_CACHE_SIZE", 2)
+    with patch.object(_SESSION, "get", return_value=_response(200, [])) as mock_get:
+        api_call("/a/", token="tok", base_url="https://s.test")
+        api_call("/b/", token="tok", base_url="https://s.test")
+        api_call("/b/", token="tok", base_url="https://s.test", cache=False)
+        api_call("/a/", token="tok", base_url="https://s.test")
+
+    assert mock_get.call_count == 3
+
+
+def test_api_call_sends_etag_and_serves_304_from_cache():
+    responses = [
+        _response(200, [{"slug": "proj"}], {"ETag": '"v1"'}),
+        _response(304),
+    ]
+
+    with patch.object(_SESSION, "get", side_effect=responses) as mock_get:
+        first = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+        second = api_call("/organizations/org/projects/", token="tok", base_url="https://s.test")
+
+    assert first == second == [{"slug": "proj"}]
+    assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_api_call_skips_cache_without_validators(isolated_cache_dir):
+    with patch.object(_SESSION, "get", return_value=_response(200, {"id": "1"})):
+        api_call("/organizations/org/issues/1/", token="tok", base_url="https://s.test")
+
+    assert not (isolated_cache_dir / "http").exists()
+
+
+def test_api_call_cache_is_keyed_by_token():
+    with patch.object(
+        _SESSION, "get", return_value=_response(200, {"id": "1"}, {"ETag": '"v1"'})
+    ) as mock_get:
+        api_call("/organizations/org/issues/1/", token="tok-a", base_url="https://s.test")
+        api_call("/organizations/org/issues/1/", token="tok-b", base_url="https://s.test")
+
+    assert "If-None-Match" not in mock_get.call_args_list[1].kwargs["headers"]
+
+
+def test_api_call_prunes_oldest_cache_entries(isolated_cache_dir, monkeypatch):
+    monkeypatch.setattr(http_cache, "MAX_ENTRIES", 2)
+    http_dir = isolated_cache_dir / "http"
+
+    with patch.object(_SESSION, "get", return_value=_response(200, {"id": "1"}, {"ETag": '"v1"'})):
+        for issue in ("1", "2"):
+            api_call(f"/organizations/org/issues/{issue}/", token="tok", base_url="https://s.test")
+        oldest = http_cache._entry_path("https://s.test/api/0/organizations/org/issues/1/", "tok")
+        os.utime(oldest, (0, 0))
+        api_call("/organizations/org/issues/3/", token="tok", base_url="https://s.test")
+
+    assert len(list(http_dir.glob("*.json"))) == 2
+    assert not oldest.exists()
+    assert not list(http_dir.glob("*.tmp"))
+
+
+def test_api_call_parses_large_body_from_raw_content():
+    pytest.importorskip("orjson")
+    body = [{"id": str(i), "title": "x" * 100} for i in range(8000)]
+    response = _response(200, body)
+
+    with patch.object(_SESSION, "get", return_value=response):
+        result = api_call("/organizations/org/issues/", token="tok", base_url="https://s.test")
+
+    assert result == body
+    response.json.assert_not_called()
+
+
+def test_api_call_falls_back_to_requests_decoder():
+    response = _response(200, {"id": "1"})
+    response.content = b"\xff\xfe not utf-8"
+
+    with patch.object(_SESSION, "get", return_value=response):
+        result = api_call("/organizations/org/issues/1/", token="tok", base_url="https://s.test")
+
+    assert result == {"id": "1"}
+
+
+def test_session_advertises_decodable_encodings():
+    accepted = _SESSION.headers["Accept-Encoding"].split(",")
+
+    assert {"gzip", "deflate"} <= set(accepted)
+    has_brotli = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+    assert ("br" in accepted) == has_brotli
+
+
+@pytest.mark.parametrize("status", [200, 204])
+def test_api_call_returns_none_for_empty_body(isolated_cache_dir, status):
+    response = _response(status, headers={"ETag": '"v1"'})
+    response.content = b""
+
+    with patch.object(_SESSION, "get", return_value=response):
+        result = api_call("/organizations/org/issues/1/", token="tok", base_url="https://s.test")
+
+    assert result is None
+    response.json.assert_not_called()
+    assert not (isolated_cache_dir / "http").exists()
+
+
+def test_warmup_opens_connection_and_ignores_errors():
+    with patch.object(
+        _SESSION, "head", side_effect=requests.exceptions.ConnectionError("down")
+    ) as mock_head:
+        warmup("https://s.test/")
+
+    assert mock_head.call_args.args[0] == "https://s.test/api/0/"
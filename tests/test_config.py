@@ -1,14 +1,17 @@
 """Tests for configuration management with profile support."""
 
 import json as json_mod
+import os
 import tomllib
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
 from sentry_tool.cli import app
+from sentry_tool.client import _SESSION
+from sentry_tool.commands.config import list_profiles, show
 from sentry_tool.config import (
     AppConfig,
     SentryProfile,
@@ -17,12 +20,15 @@ from sentry_tool.config import (
     resolve_sentry_config,
 )
 from sentry_tool.exceptions import ConfigurationError
-from sentry_tool.utils import mask_token
+from sentry_tool.output import OutputFormat
+from sentry_tool.utils import get_config, mask_token
 
-config_runner = CliRunner()
+config_runner = CliRunner(catch_exceptions=False)
 
 EXPECTED_PROFILE_COUNT = 2
 
+EXAMPLE_CONFIG_PATH = Path(__file__).parent.parent / "config.example.toml"
+
 
 # ===== Tests for mask_token() =====
 
@@ -56,14 +62,9 @@ def test_load_config_returns_defaults_when_no_file(tmp_path, monkeypatch):
     assert config.profiles["default"].url == "https://sentry.io"
 
 
-def test_load_config_loads_from_xdg_path(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
-    # Create config in XDG location
-    config_dir = tmp_path / ".config" / "sentry-tool"
-    config_dir.mkdir(parents=True)
-    config_file = config_dir / "config.toml"
-    config_file.write_text("""
+def test_load_config_loads_from_xdg_path(monkeypatch, config_home):
+    # config_home writes the file to the XDG location under a fresh HOME
+    home = config_home("""
 default_profile = "staging"
 
 [profiles.staging]
@@ -72,8 +73,7 @@ org = "test-org"
 project = "test-project"
 """)
 
-    # Mock home to tmp_path
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     config = load_config()
 
@@ -81,9 +81,7 @@ project = "test-project"
     assert config.profiles["staging"].url == "https://sentry-staging.example.com"
 
 
-def test_load_config_prefers_explicit_path(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
+def test_load_config_prefers_explicit_path(tmp_path):
     custom_config = tmp_path / "custom.toml"
     custom_config.write_text("""
 default_profile = "custom"
@@ -98,9 +96,7 @@ url = "https://custom.example.com"
     assert config.profiles["custom"].url == "https://custom.example.com"
 
 
-def test_load_config_parses_multiple_profiles(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
+def test_load_config_parses_multiple_profiles(tmp_path):
     config_file = tmp_path / "config.toml"
     config_file.write_text("""
 default_profile = "prod"
@@ -124,6 +120,63 @@ project = "dev-project"
     assert config.profiles["dev"].url == "http://localhost:9000"
 
 
+def test_load_config_caches_parsed_file(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('default_profile = "cached"\n[profiles.cached]\n')
+
+    first = load_config(config_path=config_file)
+    second = load_config(config_path=config_file)
+
+    assert first is second
+
+
+def test_load_config_cache_is_per_path(tmp_path):
+    first_file = tmp_path / "first.toml"
+    first_file.write_text('default_profile = "first"\n[profiles.first]\n')
+    second_file = tmp_path / "second.toml"
+    second_file.write_text('default_profile = "second"\n[profiles.second]\n')
+
+    assert load_config(config_path=first_file).default_profile == "first"
+    assert load_config(config_path=second_file).default_profile == "second"
+
+
+def test_load_config_reparses_after_file_changes(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('default_profile = "before"\n[profiles.before]\n')
+    assert load_config(config_path=config_file).default_profile == "before"
+
+    config_file.write_text('default_profile = "after"\n[profiles.after]\n')
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config(config_path=config_file).default_profile == "after"
+
+
+def test_load_config_ignores_unknown_keys(tmp_path):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('extra = 1\n[profiles.prod]\norg = "o"\nregion = "eu"\n')
+
+    config = load_config(config_path=config_file)
+
+    assert config.profiles["prod"] == SentryProfile(org="o")
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ("[profiles.prod]\nurl = 42\n", "profiles.prod.url must be a string"),
+        ('profiles = "prod"\n', "profiles must be a table"),
+        ("default_profile = true\n", "default_profile must be a string"),
+    ],
+)
+def test_load_config_rejects_wrong_types(tmp_path, content, message):
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(content)
+
+    with pytest.raises(ConfigurationError, match=message):
+        load_config(config_path=config_file)
+
+
 # ===== Tests for get_profile() =====
 
 
@@ -216,82 +269,80 @@ def test_resolve_sentry_config_returns_profile_values():
     assert resolved["auth_token"] == "profile_token_123"
 
 
-def test_resolve_sentry_config_env_url_overrides_profile():
-    profile = SentryProfile(url="https://profile.example.com", auth_token="token")
-
-    resolved = resolve_sentry_config(profile, env_url="https://env.example.com")
-
-    assert resolved["url"] == "https://env.example.com"
-
-
-def test_resolve_sentry_config_env_org_overrides_profile():
-    profile = SentryProfile(org="profile-org", auth_token="token")
-
-    resolved = resolve_sentry_config(profile, env_org="env-org")
-
-    assert resolved["org"] == "env-org"
-
-
-def test_resolve_sentry_config_env_project_overrides_profile():
-    profile = SentryProfile(project="profile-project", auth_token="token")
-
-    resolved = resolve_sentry_config(profile, env_project="env-project")
-
-    assert resolved["project"] == "env-project"
-
-
-def test_resolve_sentry_config_cli_project_overrides_env():
-    profile = SentryProfile(project="profile-project", auth_token="token")
-
-    resolved = resolve_sentry_config(profile, cli_project="cli-project", env_project="env-project")
-
-    assert resolved["project"] == "cli-project"
-
-
-def test_resolve_sentry_config_cli_project_overrides_profile():
-    profile = SentryProfile(project="profile-project", auth_token="token")
-
-    resolved = resolve_sentry_config(profile, cli_project="cli-project")
-
-    assert resolved["project"] == "cli-project"
-
-
-def test_resolve_sentry_config_env_auth_token_overrides_profile():
-    profile = SentryProfile(auth_token="profile_token")
+@pytest.mark.parametrize(
+    ("profile_kwargs", "resolve_kwargs", "key", "expected"),
+    [
+        pytest.param(
+            {"url": "https://profile.example.com"},
+            {"env_url": "https://env.example.com"},
+            "url",
+            "https://env.example.com",
+            id="env-url-overrides-profile",
+        ),
+        pytest.param(
+            {"org": "profile-org"},
+            {"env_org": "env-org"},
+            "org",
+            "env-org",
+            id="env-org-overrides-profile",
+        ),
+        pytest.param(
+            {"project": "profile-project"},
+            {"env_project": "env-project"},
+            "project",
+            "env-project",
+            id="env-project-overrides-profile",
+        ),
+        pytest.param(
+            {"project": "profile-project"},
+            {"cli_project": "cli-project", "env_project": "env-project"},
+            "project",
+            "cli-project",
+            id="cli-project-overrides-env",
+        ),
+        pytest.param(
+            {"project": "profile-project"},
+            {"cli_project": "cli-project"},
+            "project",
+            "cli-project",
+            id="cli-project-overrides-profile",
+        ),
+        pytest.param(
+            {"auth_token": "profile_token"},
+            {"env_auth_token": "env_token"},
+            "auth_token",
+            "env_token",
+            id="env-auth-token-overrides-profile",
+        ),
+        pytest.param(
+            {"auth_token": "  token_with_spaces  "},
+            {},
+            "auth_token",
+            "token_with_spaces",
+            id="strips-whitespace-from-token",
+        ),
+    ],
+)
+def test_resolve_sentry_config_overrides(profile_kwargs, resolve_kwargs, key, expected):
+    profile = SentryProfile(**{"auth_token": "token", **profile_kwargs})
 
-    resolved = resolve_sentry_config(profile, env_auth_token="env_token")
+    resolved = resolve_sentry_config(profile, **resolve_kwargs)
 
-    assert resolved["auth_token"] == "env_token"
+    assert resolved[key] == expected
 
 
-def test_resolve_sentry_config_raises_when_token_missing():
-    profile = SentryProfile(auth_token=None)
+@pytest.mark.parametrize("auth_token", [None, ""])
+def test_resolve_sentry_config_raises_when_token_missing(auth_token):
+    profile = SentryProfile(auth_token=auth_token)
 
     with pytest.raises(ConfigurationError, match="SENTRY_AUTH_TOKEN not set"):
         resolve_sentry_config(profile)
 
 
-def test_resolve_sentry_config_raises_when_token_empty():
-    profile = SentryProfile(auth_token="")
-
-    with pytest.raises(ConfigurationError, match="SENTRY_AUTH_TOKEN not set"):
-        resolve_sentry_config(profile)
-
-
-def test_resolve_sentry_config_strips_whitespace_from_token():
-    profile = SentryProfile(auth_token="  token_with_spaces  ")
-
-    resolved = resolve_sentry_config(profile)
-
-    assert resolved["auth_token"] == "token_with_spaces"
-
-
 # ===== Integration Tests for Full Resolution Flow =====
 
 
 def test_full_resolution_with_profile_and_env_overrides(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
     config_file = tmp_path / "config.toml"
     config_file.write_text("""
 default_profile = "staging"
@@ -344,7 +395,6 @@ def test_backwards_compatibility_env_only_no_config(tmp_path, monkeypatch):
 
 
 def test_profile_precedence_explicit_beats_env(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("SENTRY_PROFILE", "staging")
 
     config_file = tmp_path / "config.toml"
@@ -365,7 +415,6 @@ auth_token = "prod_token"
 
 
 def test_profile_precedence_env_beats_default(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("SENTRY_PROFILE", "dev")
 
     config_file = tmp_path / "config.toml"
@@ -387,6 +436,29 @@ auth_token = "dev_token"
     assert profile.url == "https://dev.example.com"
 
 
+def test_get_config_reuses_resolution_until_inputs_change(monkeypatch):
+    monkeypatch.setattr("sentry_tool.utils._active_profile", None)
+    monkeypatch.setattr("sentry_tool.utils._active_project", None)
+    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
+    monkeypatch.setenv("SENTRY_AUTH_TOKEN", "env_token")
+    monkeypatch.setenv("SENTRY_ORG", "first-org")
+    app_config = AppConfig(
+        profiles={"default": SentryProfile(url="https://s.test", org="o", project="p")}
+    )
+    monkeypatch.setattr("sentry_tool.utils.load_config", lambda: app_config)
+
+    with patch("sentry_tool.utils.resolve_sentry_config", wraps=resolve_sentry_config) as resolve:
+        first = get_config()
+        first["org"] = "mutated"
+        second = get_config()
+        monkeypatch.setenv("SENTRY_ORG", "second-org")
+        third = get_config()
+
+    assert second["org"] == "first-org"
+    assert third["org"] == "second-org"
+    assert resolve.call_count == 2
+
+
 # ===== Tests for SentryProfile Model =====
 
 
@@ -440,24 +512,20 @@ def test_app_config_accepts_custom_profiles():
 # ===== Tests for config.example.toml Validity =====
 
 
-def test_example_config_is_valid_toml():
-    example_path = Path(__file__).parent.parent / "config.example.toml"
+@pytest.fixture(scope="module")
+def example_config():
+    with EXAMPLE_CONFIG_PATH.open("rb") as f:
+        return tomllib.load(f)
 
-    with example_path.open("rb") as f:
-        config_data = tomllib.load(f)
 
-    assert "default_profile" in config_data
-    assert "profiles" in config_data
-    assert isinstance(config_data["profiles"], dict)
+def test_example_config_is_valid_toml(example_config):
+    assert "default_profile" in example_config
+    assert "profiles" in example_config
+    assert isinstance(example_config["profiles"], dict)
 
 
-def test_example_config_profiles_have_required_fields():
-    example_path = Path(__file__).parent.parent / "config.example.toml"
-
-    with example_path.open("rb") as f:
-        config_data = tomllib.load(f)
-
-    for profile_name, profile_data in config_data["profiles"].items():
+def test_example_config_profiles_have_required_fields(example_config):
+    for profile_name, profile_data in example_config["profiles"].items():
         assert "url" in profile_data, f"Profile {profile_name} missing 'url'"
         assert "org" in profile_data, f"Profile {profile_name} missing 'org'"
         assert "project" in profile_data, f"Profile {profile_name} missing 'project'"
@@ -466,10 +534,8 @@ def test_example_config_profiles_have_required_fields():
 # ===== Tests for config list-projects command =====
 
 
-def test_config_list_projects_success(tmp_path, monkeypatch, live_config):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text(f"""
+def test_config_list_projects_success(monkeypatch, live_config, config_home):
+    home = config_home(f"""
 [profiles.live]
 url = "{live_config["url"]}"
 org = "{live_config["org"]}"
@@ -477,7 +543,7 @@ project = "{live_config["project"]}"
 auth_token = "{live_config["auth_token"]}"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "list-projects"])
 
@@ -485,31 +551,29 @@ auth_token = "{live_config["auth_token"]}"
     assert "live" in result.stdout
 
 
-def test_config_list_projects_missing_token(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [("list-projects", "no auth token"), ("validate", "No auth token configured")],
+)
+def test_config_commands_report_missing_token(monkeypatch, config_home, command, expected):
+    home = config_home("""
 [profiles.staging]
 url = "https://sentry-staging.test.local"
 org = "staging-org"
 project = "staging-project"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
-    result = config_runner.invoke(app, ["config", "list-projects"])
+    result = config_runner.invoke(app, ["config", command])
 
     assert result.exit_code == 0
     assert "staging" in result.stdout
-    assert "no auth token" in result.stdout
+    assert expected in result.stdout
 
 
-def test_config_list_projects_org_not_found(tmp_path, monkeypatch, live_config):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text(f"""
+def test_config_list_projects_org_not_found(monkeypatch, live_config, config_home):
+    home = config_home(f"""
 [profiles.bogus]
 url = "{live_config["url"]}"
 org = "definitely-not-a-real-org-xyz123"
@@ -517,7 +581,7 @@ project = "test"
 auth_token = "{live_config["auth_token"]}"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "list-projects"])
 
@@ -526,14 +590,15 @@ auth_token = "{live_config["auth_token"]}"
     assert "not found" in result.stdout
 
 
+@pytest.mark.parametrize(
+    ("command", "expected"), [("list-projects", "error"), ("validate", "FAIL")]
+)
 @patch(
     "sentry_tool.commands.config.api_call",
     side_effect=ConnectionError("connection refused"),
 )
-def test_config_list_projects_generic_exception(mock_api, tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
+def test_config_commands_report_api_errors(mock_api, monkeypatch, config_home, command, expected):
+    home = config_home("""
 [profiles.staging]
 url = "https://sentry-staging.test.local"
 org = "staging-org"
@@ -541,22 +606,51 @@ project = "staging-project"
 auth_token = "staging_token"
 """)  # pragma: allowlist secret
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
-    result = config_runner.invoke(app, ["config", "list-projects"])
+    result = config_runner.invoke(app, ["config", command])
 
     assert result.exit_code == 0
     assert "staging" in result.stdout
-    assert "error" in result.stdout.lower()
+    assert expected in result.stdout
+    # validate must not be answered from the in-memory response cache
+    assert mock_api.call_args.kwargs["cache"] is (command != "validate")
+
+
+def test_config_list_projects_preserves_profile_order(monkeypatch, config_home):
+    home = config_home("""
+[profiles.zeta]
+url = "https://sentry-zeta.test.local"
+org = "zeta-org"
+auth_token = "zeta_token"
+
+[profiles.alpha]
+url = "https://sentry-alpha.test.local"
+org = "alpha-org"
+auth_token = "alpha_token"
+""")  # pragma: allowlist secret
+
+    monkeypatch.setenv("HOME", str(home))
+
+    def fake_api_call(endpoint, token, base_url, cache=True):
+        return [{"slug": endpoint.split("/")[2].replace("-org", "-proj")}]
+
+    with patch("sentry_tool.commands.config.api_call", side_effect=fake_api_call):
+        result = config_runner.invoke(app, ["config", "list-projects", "--format", "json"])
+
+    assert result.exit_code == 0
+    data = json_mod.loads(result.stdout)
+    assert data == [
+        {"profile": "zeta", "project": "zeta-proj"},
+        {"profile": "alpha", "project": "alpha-proj"},
+    ]
 
 
 # ===== Tests for config validate command =====
 
 
-def test_config_validate_success(tmp_path, monkeypatch, live_config):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text(f"""
+def test_config_validate_success(monkeypatch, live_config, config_home):
+    home = config_home(f"""
 [profiles.live]
 url = "{live_config["url"]}"
 org = "{live_config["org"]}"
@@ -564,7 +658,7 @@ project = "{live_config["project"]}"
 auth_token = "{live_config["auth_token"]}"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "validate"])
 
@@ -573,31 +667,8 @@ auth_token = "{live_config["auth_token"]}"
     assert "OK" in result.stdout
 
 
-def test_config_validate_missing_token(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-""")
-
-    monkeypatch.setenv("HOME", str(tmp_path))
-
-    result = config_runner.invoke(app, ["config", "validate"])
-
-    assert result.exit_code == 0
-    assert "staging" in result.stdout
-    assert "No auth token configured" in result.stdout
-
-
-def test_config_validate_org_not_found(tmp_path, monkeypatch, live_config):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text(f"""
+def test_config_validate_org_not_found(monkeypatch, live_config, config_home):
+    home = config_home(f"""
 [profiles.bogus]
 url = "{live_config["url"]}"
 org = "definitely-not-a-real-org-xyz123"
@@ -605,7 +676,7 @@ project = "test"
 auth_token = "{live_config["auth_token"]}"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "validate"])
 
@@ -614,54 +685,30 @@ auth_token = "{live_config["auth_token"]}"
     assert "not found" in result.stdout
 
 
-@patch(
-    "sentry_tool.commands.config.api_call",
-    side_effect=ConnectionError("connection refused"),
-)
-def test_config_validate_generic_exception(mock_api, tmp_path, monkeypatch):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token"
+def test_config_validate_handles_no_content_response(monkeypatch, config_home):
+    home = config_home("""
+[profiles.empty]
+url = "https://sentry-empty.test.local"
+org = "empty-org"
+auth_token = "empty_token"
 """)  # pragma: allowlist secret
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
+    response = MagicMock(status_code=204, headers={}, content=b"")
 
-    result = config_runner.invoke(app, ["config", "validate"])
+    with patch.object(_SESSION, "get", return_value=response):
+        result = config_runner.invoke(app, ["config", "validate"])
 
     assert result.exit_code == 0
-    assert "staging" in result.stdout
-    assert "FAIL" in result.stdout
+    assert "empty" in result.stdout
+    assert "OK" in result.stdout
 
 
 # ===== Tests for config show command =====
 
 
-def test_config_show_table_displays_profiles(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
-    monkeypatch.delenv("SENTRY_URL", raising=False)
-    monkeypatch.delenv("SENTRY_ORG", raising=False)
-    monkeypatch.delenv("SENTRY_PROJECT", raising=False)
-    monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-default_profile = "staging"
-
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token_abcd"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_config_show_table_displays_profiles(monkeypatch, staging_home, clean_sentry_env):
+    monkeypatch.setenv("HOME", str(staging_home))
 
     result = config_runner.invoke(app, ["config", "show"])
 
@@ -673,17 +720,8 @@ auth_token = "staging_token_abcd"
     assert "Effective Settings" in result.stdout
 
 
-def test_config_show_json_output(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
-    monkeypatch.delenv("SENTRY_URL", raising=False)
-    monkeypatch.delenv("SENTRY_ORG", raising=False)
-    monkeypatch.delenv("SENTRY_PROJECT", raising=False)
-    monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
+def test_config_show_json_output(monkeypatch, config_home, clean_sentry_env, capsys):
+    home = config_home("""
 default_profile = "prod"
 
 [profiles.prod]
@@ -693,13 +731,11 @@ project = "prod-project"
 auth_token = "prod_token_7890"
 """)  # pragma: allowlist secret
 
-    monkeypatch.setenv("HOME", str(tmp_path))
-
-    result = config_runner.invoke(app, ["config", "show", "--format", "json"])
+    monkeypatch.setenv("HOME", str(home))
 
-    assert result.exit_code == 0
+    show(format=OutputFormat.json)
 
-    data = json_mod.loads(result.stdout)
+    data = json_mod.loads(capsys.readouterr().out)
     assert data["default_profile"] == "prod"
     assert data["active_profile"] == "prod"
     assert data["effective"]["url"] == "https://sentry-prod.test.local"
@@ -709,27 +745,10 @@ auth_token = "prod_token_7890"
     assert data["profiles"]["prod"]["url"] == "https://sentry-prod.test.local"
 
 
-def test_config_show_with_env_overrides(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-default_profile = "staging"
-
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token_abcd"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_config_show_with_env_overrides(monkeypatch, staging_home, clean_sentry_env):
+    monkeypatch.setenv("HOME", str(staging_home))
     monkeypatch.setenv("SENTRY_URL", "https://override.test.local")
     monkeypatch.setenv("SENTRY_ORG", "override-org")
-    monkeypatch.delenv("SENTRY_PROJECT", raising=False)
-    monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
 
     result = config_runner.invoke(app, ["config", "show"])
 
@@ -740,33 +759,13 @@ auth_token = "staging_token_abcd"
     assert "SENTRY_ORG" in result.stdout
 
 
-def test_config_show_json_with_env_overrides(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.delenv("SENTRY_PROFILE", raising=False)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
-default_profile = "staging"
-
-[profiles.staging]
-url = "https://sentry-staging.test.local"
-org = "staging-org"
-project = "staging-project"
-auth_token = "staging_token_abcd"
-""")  # pragma: allowlist secret
-
-    monkeypatch.setenv("HOME", str(tmp_path))
+def test_config_show_json_with_env_overrides(monkeypatch, staging_home, clean_sentry_env, capsys):
+    monkeypatch.setenv("HOME", str(staging_home))
     monkeypatch.setenv("SENTRY_URL", "https://env-override.test.local")
-    monkeypatch.delenv("SENTRY_ORG", raising=False)
-    monkeypatch.delenv("SENTRY_PROJECT", raising=False)
-    monkeypatch.delenv("SENTRY_AUTH_TOKEN", raising=False)
 
-    result = config_runner.invoke(app, ["config", "show", "--format", "json"])
+    show(format=OutputFormat.json)
 
-    assert result.exit_code == 0
-
-    data = json_mod.loads(result.stdout)
+    data = json_mod.loads(capsys.readouterr().out)
     assert data["effective"]["url"] == "https://env-override.test.local"
     assert data["effective"]["org"] == "staging-org"
 
@@ -774,12 +773,8 @@ auth_token = "staging_token_abcd"
 # ===== Tests for config profiles command =====
 
 
-def test_config_profiles_table(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
+def test_config_profiles_table(monkeypatch, config_home):
+    home = config_home("""
 default_profile = "prod"
 
 [profiles.prod]
@@ -789,7 +784,7 @@ url = "https://sentry-prod.test.local"
 url = "https://sentry-staging.test.local"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "profiles"])
 
@@ -799,12 +794,8 @@ url = "https://sentry-staging.test.local"
     assert "2 profiles" in result.stdout
 
 
-def test_config_profiles_json(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
-
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text("""
+def test_config_profiles_json(monkeypatch, config_home, capsys):
+    home = config_home("""
 default_profile = "prod"
 
 [profiles.prod]
@@ -814,13 +805,11 @@ url = "https://sentry-prod.test.local"
 url = "https://sentry-dev.test.local"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
-    result = config_runner.invoke(app, ["config", "profiles", "--format", "json"])
+    list_profiles(format=OutputFormat.json)
 
-    assert result.exit_code == 0
-
-    data = json_mod.loads(result.stdout)
+    data = json_mod.loads(capsys.readouterr().out)
     names = [row["name"] for row in data]
     assert "prod" in names
     assert "dev" in names
@@ -829,10 +818,8 @@ url = "https://sentry-dev.test.local"
 # ===== Tests for config list-projects --format json =====
 
 
-def test_config_list_projects_json(tmp_path, monkeypatch, live_config):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text(f"""
+def test_config_list_projects_json(monkeypatch, live_config, config_home):
+    home = config_home(f"""
 [profiles.live]
 url = "{live_config["url"]}"
 org = "{live_config["org"]}"
@@ -840,7 +827,7 @@ project = "{live_config["project"]}"
 auth_token = "{live_config["auth_token"]}"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "list-projects", "--format", "json"])
 
@@ -854,10 +841,8 @@ auth_token = "{live_config["auth_token"]}"
 # ===== Tests for config validate --format json =====
 
 
-def test_config_validate_json(tmp_path, monkeypatch, live_config):
-    config_file = tmp_path / ".config" / "sentry-tool" / "config.toml"
-    config_file.parent.mkdir(parents=True)
-    config_file.write_text(f"""
+def test_config_validate_json(monkeypatch, live_config, config_home):
+    home = config_home(f"""
 [profiles.live]
 url = "{live_config["url"]}"
 org = "{live_config["org"]}"
@@ -865,7 +850,7 @@ project = "{live_config["project"]}"
 auth_token = "{live_config["auth_token"]}"
 """)
 
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(home))
 
     result = config_runner.invoke(app, ["config", "validate", "--format", "json"])
 
@@ -1,22 +1,88 @@
-from unittest.mock import MagicMock, patch
+import json
+import logging
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from sentry_tool import cli
+from sentry_tool.config import AppConfig
+from sentry_tool.monitoring import (
+    get_logger,
+    log_enabled,
+    report_exception,
+    resolve_dsn,
+    setup_logging,
+    setup_sentry,
+)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "environment"), [({}, "local"), ({"environment": "test"}, "test")]
+)
+def test_setup_sentry_initializes_sdk(monkeypatch, kwargs, environment):
+    # Stub init: the real one starts a transport thread and could send events.
+    monkeypatch.setenv("SENTRY_DSN", "https://key@sentry.test/1")
+    with patch("sentry_sdk.init") as mock_init:
+        setup_sentry(**kwargs)
+
+    mock_init.assert_called_once()
+    assert mock_init.call_args.kwargs["dsn"] == "https://key@sentry.test/1"
+    assert mock_init.call_args.kwargs["environment"] == environment
 
-from sentry_tool.monitoring import get_logger, resolve_dsn, setup_logging, setup_sentry
 
-
-def test_setup_sentry_does_not_crash():
-    setup_sentry()
+def test_setup_logging_does_not_crash():
+    setup_logging()
 
 
-def test_setup_sentry_with_environment():
-    setup_sentry(environment="test")
+def test_setup_logging_verbose_enables_debug():
+    setup_logging(verbose=True)
 
 
-def test_setup_logging_does_not_crash():
+def test_setup_logging_writes_json_lines_when_not_a_terminal(capsys):
+    saved = structlog.get_config()
+    try:
+        setup_logging()
+        structlog.get_logger().info("hello", count=2)
+    finally:
+        structlog.configure(**saved)
+
+    record = json.loads(capsys.readouterr().err)
+    assert record["event"] == "hello"
+    assert record["count"] == 2
+    assert record["level"] == "info"
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_setup_logging_json_lines_include_tracebacks(monkeypatch, capsys, has_orjson):
+    monkeypatch.setattr("sentry_tool.monitoring._HAS_ORJSON", has_orjson)
+    saved = structlog.get_config()
+    try:
+        setup_logging()
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            structlog.get_logger().exception("failed")
+    finally:
+        structlog.configure(**saved)
+
+    record = json.loads(capsys.readouterr().err)
+    assert record["event"] == "failed"
+    assert "Traceback" in record["exception"]
+    assert "ValueError: bad value" in record["exception"]
+
+
+def test_log_enabled_follows_setup_logging_level():
     setup_logging()
+    assert log_enabled(logging.INFO)
+    assert not log_enabled(logging.DEBUG)
 
-
-def test_setup_logging_verbose_enables_debug():
     setup_logging(verbose=True)
+    assert log_enabled(logging.DEBUG)
+    setup_logging()
 
 
 def test_get_logger_returns_bound_logger():
@@ -25,40 +91,114 @@ def test_get_logger_returns_bound_logger():
     assert hasattr(logger, "bind")
 
 
-def test_resolve_dsn_returns_env_var_when_set(monkeypatch):
-    env_dsn = "https://envtoken@sentry.example.com/1"
+def test_get_logger_reuses_logger_per_name():
+    assert get_logger("test") is get_logger("test")
+    assert get_logger("test") is not get_logger("other")
+
+
+def test_get_logger_follows_later_setup_logging(capsys):
+    logger = get_logger("late")
+    saved = structlog.get_config()
+    try:
+        logger.debug("bound before setup")
+        setup_logging()
+        setup_logging(verbose=True)
+        logger.debug("detail")
+    finally:
+        structlog.configure(**saved)
+        setup_logging()
+
+    record = json.loads(capsys.readouterr().err)
+    assert record["event"] == "detail"
+    assert record["logger"] == "late"
+
+
+ENV_DSN = "https://envtoken@sentry.example.com/1"
+CONFIG_DSN = "https://configtoken@sentry.example.com/2"
+
+
+@pytest.mark.parametrize("env_dsn", [ENV_DSN, ""])
+def test_resolve_dsn_env_var_skips_config(monkeypatch, env_dsn):
     monkeypatch.setenv("SENTRY_DSN", env_dsn)
 
-    assert resolve_dsn() == env_dsn
+    with patch("sentry_tool.monitoring.load_config") as mock_load:
+        assert resolve_dsn() == env_dsn
 
+    mock_load.assert_not_called()
 
-def test_resolve_dsn_falls_back_to_config_file(monkeypatch):
-    monkeypatch.delenv("SENTRY_DSN", raising=False)
 
-    config_dsn = "https://configtoken@sentry.example.com/2"
-    mock_config = MagicMock()
-    mock_config.sentry_dsn = config_dsn
+@pytest.mark.parametrize("config_dsn", [CONFIG_DSN, None])
+def test_resolve_dsn_falls_back_to_config_file(monkeypatch, config_dsn):
+    monkeypatch.delenv("SENTRY_DSN", raising=False)
 
-    with patch("sentry_tool.monitoring.load_config", return_value=mock_config):
+    with patch("sentry_tool.monitoring.load_config", return_value=AppConfig(sentry_dsn=config_dsn)):
         assert resolve_dsn() == config_dsn
 
 
-def test_resolve_dsn_returns_none_for_hardcoded_default(monkeypatch):
-    monkeypatch.delenv("SENTRY_DSN", raising=False)
+def test_setup_sentry_disabled_by_empty_dsn(monkeypatch):
+    monkeypatch.setenv("SENTRY_DSN", "")
 
-    mock_config = MagicMock()
-    mock_config.sentry_dsn = None
+    with patch("sentry_sdk.init") as mock_init:
+        setup_sentry()
 
-    with patch("sentry_tool.monitoring.load_config", return_value=mock_config):
-        assert resolve_dsn() is None
+    mock_init.assert_not_called()
 
 
-def test_resolve_dsn_env_var_takes_priority_over_config(monkeypatch):
-    env_dsn = "https://envtoken@sentry.example.com/1"
-    monkeypatch.setenv("SENTRY_DSN", env_dsn)
+def test_report_exception_initializes_sentry_and_captures():
+    exc = RuntimeError("boom")
 
-    with patch("sentry_tool.monitoring.load_config") as mock_load:
-        result = resolve_dsn()
+    with (
+        patch("sentry_tool.monitoring.setup_sentry") as mock_setup,
+        patch("sentry_sdk.capture_exception") as mock_capture,
+    ):
+        report_exception(exc, environment="test")
 
-    mock_load.assert_not_called()
-    assert result == env_dsn
+    mock_setup.assert_called_once_with(environment="test")
+    mock_capture.assert_called_once_with(exc)
+
+
+def test_report_exception_skips_sentry_sdk_when_disabled():
+    script = (
+        "import os, sys\n"
+        "os.environ['SENTRY_DSN'] = ''\n"
+        "from sentry_tool.monitoring import report_exception\n"
+        "report_exception(RuntimeError('boom'))\n"
+        "print('sentry_sdk' in sys.modules)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_reports_unhandled_exception_and_reraises():
+    exc = RuntimeError("boom")
+
+    with (
+        patch.object(cli, "app", side_effect=exc),
+        patch("sentry_tool.monitoring.report_exception") as mock_report,
+        pytest.raises(RuntimeError, match="boom"),
+    ):
+        cli.cli()
+
+    mock_report.assert_called_once_with(exc, environment="local")
+
+
+def test_importing_cli_does_not_import_sentry_sdk():
+    script = "import sys\nimport sentry_tool.cli\nprint('sentry_sdk' in sys.modules)\n"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_does_not_init_sentry_on_success():
+    with (
+        patch.object(cli, "app"),
+        patch("sentry_tool.monitoring.setup_sentry") as mock_setup,
+    ):
+        cli.cli()
+
+    mock_setup.assert_not_called()
@@ -0,0 +1,132 @@
+"""Tests for generic output formatting."""
+
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+from sentry_tool import output
+from sentry_tool.output import dumps_json
+
+SAMPLE = {"profiles": {"prod": {"url": "https://s.test", "count": 3}}, "items": [1, None, True]}
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_dumps_json_matches_stdlib_layout(monkeypatch, has_orjson):
+    monkeypatch.setattr(output, "_HAS_ORJSON", has_orjson)
+
+    assert dumps_json(SAMPLE) == json.dumps(SAMPLE, indent=2)
+
+
+def test_render_json_prints_indented_json(capsys):
+    output.render([{"id": "1"}], output.OutputFormat.json)
+
+    assert json.loads(capsys.readouterr().out) == [{"id": "1"}]
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_print_json_matches_stdlib_layout(monkeypatch, capsys, has_orjson):
+    monkeypatch.setattr(output, "_HAS_ORJSON", has_orjson)
+
+    output.print_json(SAMPLE)
+
+    assert capsys.readouterr().out == json.dumps(SAMPLE, indent=2) + "\n"
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_json_output_keeps_unicode_and_big_ints(monkeypatch, capsys, has_orjson):
+    monkeypatch.setattr(output, "_HAS_ORJSON", has_orjson)
+    data = {"title": "café", "count": 2**70}
+    expected = '{\n  "title": "café",\n  "count": 1180591620717411303424\n}'
+
+    assert dumps_json(data) == expected
+    output.print_json(data)
+    assert capsys.readouterr().out == expected + "\n"
+
+
+def test_get_console_is_shared_per_stream():
+    assert output.get_console() is output.get_console()
+    assert output.get_console(stderr=True).stderr
+    assert output.get_console(stderr=True) is not output.get_console()
+
+
+def test_column_is_immutable():
+    column = output.Column("ID", "id")
+
+    with pytest.raises(AttributeError):
+        column.header = "Other"  # type: ignore[misc]
+
+
+def test_get_console_plain_when_not_a_terminal(capsys):
+    output.get_console.cache_clear()
+    try:
+        console = output.get_console()
+        console.print("x" * 200)
+    finally:
+        output.get_console.cache_clear()
+
+    assert console.no_color
+    assert capsys.readouterr().out == "x" * 200 + "\n"
+
+
+def test_build_table_defaults_columns_to_row_keys():
+    table = output.build_table([{"id": "1", "name": "web"}])
+
+    assert [column.header for column in table.columns] == ["id", "name"]
+    assert table.row_count == 1
+
+
+@pytest.mark.parametrize("keys", [("id",), ("id", "name")])
+def test_build_table_fills_missing_keys_with_blank(keys):
+    columns = [output.Column(key, key) for key in keys]
+    data = [dict.fromkeys(keys, 1), {}]
+
+    table = output.build_table(data, columns)
+
+    assert [list(column.cells) for column in table.columns] == [["1", ""]] * len(keys)
+
+
+def test_render_tsv_writes_header_and_escaped_rows(capsys):
+    columns = [output.Column("ID", "id"), output.Column("Title", "title")]
+    data = [{"id": 1, "title": "a\tb\nc"}, {"id": 2}]
+
+    output.render(data, output.OutputFormat.tsv, columns=columns, footer="Showing 2")
+
+    assert capsys.readouterr().out == "ID\tTitle\n1\ta b c\n2\t\n"
+
+
+def test_render_tsv_empty_data_writes_nothing(capsys):
+    output.render([], output.OutputFormat.tsv)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_print_exception_entry_keeps_markup_in_event_data_literal():
+    console = Console(file=io.StringIO(), width=120)
+    data = {
+        "values": [
+            {
+                "type": "ValueError",
+                "value": "bad tag [bold]x[/bold]",
+                "stacktrace": {"frames": [{"filename": "a.py", "lineNo": 3, "function": "f"}]},
+            }
+        ]
+    }
+
+    output.print_exception_entry(console, data)
+
+    assert console.file.getvalue() == (
+        "\nException:\n  ValueError: bad tag [bold]x[/bold]\n  Stacktrace:\n    a.py:3 in f\n"
+    )
+
+
+def test_render_table_empty_data_skips_console(monkeypatch, capsys):
+    def fail() -> None:
+        raise AssertionError("console should not be created for empty data")
+
+    monkeypatch.setattr(output, "get_console", fail)
+
+    output.render([], output.OutputFormat.table, footer="Showing 0 issues")
+
+    assert capsys.readouterr().out == ""
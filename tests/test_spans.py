@@ -1,7 +1,10 @@
 from io import StringIO
+from unittest.mock import patch
 
+import click
 import pytest
 from rich.console import Console
+from typer.main import get_group
 from typer.testing import CliRunner
 
 from sentry_tool.cli import app
@@ -10,9 +13,11 @@ from sentry_tool.commands.traces import (
     _build_span_tree,
     _extract_spans,
     _render_span_tree,
+    _render_timeline,
+    _span_entries,
 )
 
-runner = CliRunner()
+runner = CliRunner(catch_exceptions=False)
 
 
 # ===== SpanNode dataclass tests =====
@@ -42,6 +47,11 @@ def test_spannode_children_are_mutable():
     assert parent.children[0] is child
 
 
+def test_spannode_has_no_instance_dict():
+    node = SpanNode(span_id="s", parent_span_id=None, op="db", description="", duration=0.0)
+    assert not hasattr(node, "__dict__")
+
+
 # ===== _extract_spans tests =====
 
 
@@ -60,6 +70,18 @@ def test_extract_spans_no_spans_entry():
     assert txn_duration == 0.0
 
 
+def test_span_entries_uses_first_spans_entry():
+    event = {
+        "entries": [
+            {"type": "request", "data": {"url": "/api"}},
+            {"type": "spans", "data": [{"span_id": "a"}]},
+            {"type": "spans", "data": [{"span_id": "b"}]},
+            {"data": "untyped"},
+        ]
+    }
+    assert _span_entries(event) == [{"span_id": "a"}]
+
+
 def test_extract_spans_missing_duration(sample_transaction_spans):
     event = {
         "contexts": {"trace": {"span_id": "root001"}},
@@ -119,6 +141,17 @@ def test_build_span_tree_fixture_hierarchy(sample_transaction_spans):
     assert child002.children[0].span_id == "grandchild001"
 
 
+def test_build_span_tree_child_listed_before_parent():
+    spans = [
+        {"span_id": "c1", "parent_span_id": "p", "op": "db", "description": "first"},
+        {"span_id": "p", "parent_span_id": "root", "op": "http", "description": "GET /"},
+        {"span_id": "c2", "parent_span_id": "p", "op": "db", "description": "second"},
+    ]
+    root = _build_span_tree(spans, "root")
+    assert [c.span_id for c in root.children] == ["p"]
+    assert [c.span_id for c in root.children[0].children] == ["c1", "c2"]
+
+
 def test_build_span_tree_orphan_attaches_to_root():
     spans = [
         {
@@ -135,6 +168,28 @@ def test_build_span_tree_orphan_attaches_to_root():
     assert root.children[0].span_id == "orphan"
 
 
+def test_build_span_tree_orphans_keep_span_order():
+    spans = [
+        {"span_id": "a", "parent_span_id": "root", "op": "db"},
+        {"span_id": "orphan", "parent_span_id": "missing", "op": "db"},
+        {"span_id": "b", "parent_span_id": None, "op": "http"},
+    ]
+    root = _build_span_tree(spans, "root")
+    assert [c.span_id for c in root.children] == ["a", "orphan", "b"]
+
+
+def test_build_span_tree_skips_root_span_without_warning():
+    spans = [
+        {"span_id": "root", "parent_span_id": None, "op": "http.server"},
+        {"span_id": "c", "parent_span_id": "root", "op": "db"},
+    ]
+    with patch("sentry_tool.commands.traces.log") as log:
+        root = _build_span_tree(spans, "root")
+
+    log.warning.assert_not_called()
+    assert [c.span_id for c in root.children] == ["c"]
+
+
 def test_build_span_tree_none_root_id():
     spans = [
         {
@@ -263,6 +318,26 @@ def test_render_span_tree_description_truncation(rich_console):
     assert long_desc not in output
 
 
+def test_render_span_tree_shows_brackets_literally(rich_console):
+    root = SpanNode(
+        span_id="root", parent_span_id=None, op="transaction", description="", duration=0.0
+    )
+    root.children = [
+        SpanNode(
+            span_id="c",
+            parent_span_id="root",
+            op="db.query",
+            description="SELECT tags[/1] FROM [bold]",
+            duration=0.1,
+        ),
+    ]
+
+    console, buf = rich_console
+    _render_span_tree(root, 1, 0.100, console=console)
+
+    assert "SELECT tags[/1] FROM [bold]" in buf.getvalue()
+
+
 def test_render_span_tree_placeholders(rich_console):
     root = SpanNode(
         span_id="root", parent_span_id=None, op="transaction", description="", duration=0.0
@@ -285,6 +360,46 @@ def test_render_span_tree_placeholders(rich_console):
     assert "(no description)" in output
 
 
+def test_render_span_tree_keeps_nesting_and_sibling_order(rich_console):
+    root = SpanNode(
+        span_id="root", parent_span_id=None, op="transaction", description="", duration=0.0
+    )
+    parent = SpanNode(span_id="p", parent_span_id="root", op="http", description="a", duration=0.3)
+    parent.children = [
+        SpanNode(span_id="c1", parent_span_id="p", op="db", description="first", duration=0.1),
+        SpanNode(span_id="c2", parent_span_id="p", op="db", description="second", duration=0.1),
+    ]
+    root.children = [parent]
+
+    console, buf = rich_console
+    _render_span_tree(root, 3, 0.300, console=console)
+    lines = buf.getvalue().splitlines()
+
+    first = next(i for i, line in enumerate(lines) if "first" in line)
+    second = next(i for i, line in enumerate(lines) if "second" in line)
+    http = next(i for i, line in enumerate(lines) if "http" in line)
+    assert http < first < second
+    assert lines[first].index("db") > lines[http].index("http")
+
+
+def test_render_span_tree_handles_deep_nesting(rich_console):
+    root = SpanNode(
+        span_id="root", parent_span_id=None, op="transaction", description="", duration=0.0
+    )
+    node = root
+    for i in range(1100):
+        child = SpanNode(
+            span_id=f"s{i}", parent_span_id=node.span_id, op="fn", description="", duration=0.0
+        )
+        node.children = [child]
+        node = child
+
+    console, buf = rich_console
+    _render_span_tree(root, 1100, 0.0, console=console)
+
+    assert "1100 spans" in buf.getvalue()
+
+
 def test_render_span_tree_footer(rich_console):
     root = SpanNode(
         span_id="root", parent_span_id=None, op="transaction", description="", duration=0.0
@@ -298,6 +413,32 @@ def test_render_span_tree_footer(rich_console):
     assert "0.500s total" in output
 
 
+# ===== _render_timeline tests =====
+
+
+def test_render_timeline_offsets_relative_to_earliest_span(rich_console):
+    spans = [
+        {"op": "http", "description": "GET /", "start_timestamp": 10.0, "timestamp": 12.0},
+        {"op": "db", "description": "SELECT", "start_timestamp": 10.5, "timestamp": 11.0},
+    ]
+
+    console, buf = rich_console
+    _render_timeline(spans, console)
+    output = buf.getvalue()
+
+    assert "0.500s" in output
+    assert "Total duration: 2.000s" in output
+
+
+def test_render_timeline_zero_duration(rich_console):
+    spans = [{"op": "db", "start_timestamp": 5.0, "timestamp": 5.0}]
+
+    console, buf = rich_console
+    _render_timeline(spans, console)
+
+    assert "zero duration" in buf.getvalue()
+
+
 # ===== CLI integration tests =====
 
 
@@ -336,21 +477,21 @@ def test_spans_op_filter_no_match(live_transaction_cli_env, live_transaction_id)
 
 
 def test_spans_404(live_cli_env):
-    result = runner.invoke(app, ["spans", "definitely_not_real_event_id"])
+    result = runner.invoke(app, ["spans", "definitely_not_real_event_id"], catch_exceptions=True)
 
     assert result.exit_code == 1
 
 
 def test_spans_in_help():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "spans" in result.stdout
+    group = get_group(app)
+    assert "spans" in group.list_commands(click.Context(group))
 
 
 def test_spans_command_help():
-    result = runner.invoke(app, ["spans", "--help"])
+    group = get_group(app)
+    spans = group.get_command(click.Context(group), "spans")
+    assert spans is not None
+    opts = {opt for param in spans.params for opt in param.opts}
 
-    assert result.exit_code == 0
-    assert "--op" in result.stdout
-    assert "--format" in result.stdout
+    assert "--op" in opts
+    assert "--format" in opts
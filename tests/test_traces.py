@@ -1,15 +1,18 @@
+import click
 import pytest
 import typer
+from typer.main import get_group
 from typer.testing import CliRunner
 
 from sentry_tool.cli import app
 from sentry_tool.commands.traces import (
     _build_query,
+    _is_trace_id,
     _parse_duration_gt,
     _validate_period,
 )
 
-runner = CliRunner()
+runner = CliRunner(catch_exceptions=False)
 
 
 def test_list_transactions_table(live_cli_env):
@@ -24,11 +27,10 @@ def test_list_transactions_json(live_cli_env):
     assert result.exit_code == 0
 
 
-def test_transactions_in_help():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "transactions" in result.stdout
+@pytest.mark.parametrize("command", ["transactions", "trace", "transaction"])
+def test_command_registered(command):
+    group = get_group(app)
+    assert command in group.list_commands(click.Context(group))
 
 
 def test_trace_lookup_table(live_transaction_cli_env, live_trace_id):
@@ -63,11 +65,19 @@ def test_trace_lookup_invalid_id_too_short():
     assert result.exit_code == 2
 
 
-def test_trace_in_help():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "trace" in result.stdout
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("abc123def456789012345678901234ab", True),
+        ("ABC123DEF456789012345678901234AB", True),
+        ("abc123def456789012345678901234a", False),
+        ("abc123def456789012345678901234ag", False),
+        ("abc123def456789012345678901234a\n", False),
+        ("abc123def456789012345678901234 a", False),
+    ],
+)
+def test_is_trace_id(value, expected):
+    assert _is_trace_id(value) is expected
 
 
 def test_transaction_detail_table(live_transaction_cli_env, live_transaction_id):
@@ -85,7 +95,9 @@ def test_transaction_detail_json(live_transaction_cli_env, live_transaction_id):
 
 
 def test_transaction_detail_404(live_cli_env):
-    result = runner.invoke(app, ["transaction", "definitely_not_a_real_event"])
+    result = runner.invoke(
+        app, ["transaction", "definitely_not_a_real_event"], catch_exceptions=True
+    )
 
     assert result.exit_code == 1
 
@@ -96,13 +108,6 @@ def test_transaction_timeline(live_transaction_cli_env, live_transaction_id):
     assert result.exit_code == 0
 
 
-def test_transaction_in_help():
-    result = runner.invoke(app, ["--help"])
-
-    assert result.exit_code == 0
-    assert "transaction" in result.stdout
-
-
 # ===== _build_query unit tests =====
 
 
@@ -267,6 +272,79 @@ def test_transactions_stats_mode_uses_aggregation_fields(mock_api, mock_cli_env)
     assert "sort=-count()" in endpoint
 
 
+def test_transactions_url_limits_page_size(mock_api, mock_cli_env):
+    result = runner.invoke(app, ["transactions", "-n", "5"])
+    assert result.exit_code == 0
+    assert "per_page=5" in mock_api["endpoint"]
+
+
+def test_transactions_page_size_is_capped(mock_api, mock_cli_env):
+    result = runner.invoke(app, ["transactions", "-n", "500"])
+    assert result.exit_code == 0
+    assert "per_page=100" in mock_api["endpoint"]
+
+
+def test_trace_url_sorts_and_limits_server_side(mock_api, mock_cli_env):
+    result = runner.invoke(app, ["trace", "a" * 32, "-n", "3"])
+    assert result.exit_code == 0
+    assert "sort=timestamp" in mock_api["endpoint"]
+    assert "per_page=3" in mock_api["endpoint"]
+
+
+def test_show_transaction_renders_trace_context_and_spans(monkeypatch, mock_cli_env):
+    event = {
+        "title": "GET /api",
+        "eventID": "d3f1d81247ad4516b61da92f1db050dd",
+        "contexts": {"trace": {"trace_id": "trace-abc", "span_id": "span-1", "duration": 120}},
+        "entries": [
+            {"type": "request", "data": {}},
+            {
+                "type": "spans",
+                "data": [
+                    {
+                        "op": "db.query",
+                        "description": "SELECT 1",
+                        "start_timestamp": 1.0,
+                        "timestamp": 1.5,
+                    }
+                ],
+            },
+        ],
+    }
+    monkeypatch.setattr("sentry_tool.commands.traces.api", lambda *a, **kw: event)
+
+    result = runner.invoke(app, ["transaction", event["eventID"]])
+
+    assert result.exit_code == 0
+    assert "trace-abc" in result.stdout
+    assert "120 ms" in result.stdout
+    assert "db.query" in result.stdout
+    assert "1 spans" in result.stdout
+
+
+def test_spans_op_filter_ignores_blank_entries(monkeypatch, mock_cli_env):
+    event = {
+        "entries": [
+            {
+                "type": "spans",
+                "data": [
+                    {"span_id": "a", "op": "db.query"},
+                    {"span_id": "b", "op": ""},
+                    {"span_id": "c", "op": "http.client"},
+                ],
+            }
+        ],
+    }
+    monkeypatch.setattr("sentry_tool.commands.traces.api", lambda *a, **kw: event)
+
+    result = runner.invoke(app, ["spans", "abc", "--op", "db.query, ,", "--format", "json"])
+
+    assert result.exit_code == 0
+    assert '"span_id": "a"' in result.stdout
+    assert '"span_id": "b"' not in result.stdout
+    assert '"span_id": "c"' not in result.stdout
+
+
 def test_transactions_invalid_period_exits_nonzero(mock_cli_env):
     result = runner.invoke(app, ["transactions", "--period", "bogus"])
     assert result.exit_code != 0